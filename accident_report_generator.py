@@ -4,9 +4,15 @@ ReportLabを使用して事故報告書のPDFを生成します
 HTMLテンプレートに忠実なレイアウトを実現します
 """
 import os
-from datetime import datetime
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+from functools import lru_cache
+from html import escape
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
 try:
     from reportlab.lib.units import mm, pt
 except (ImportError, AttributeError):
@@ -20,124 +26,518 @@ except (ImportError, AttributeError):
         # フォールバック: 標準的な値を直接定義
         mm = 2.834645669291339  # 1mm = 2.834645669291339 points
         pt = 1.0  # 1pt = 1.0 point
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.cidfonts import UnicodeCIDFont
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.platypus import Table, TableStyle, Paragraph, Spacer
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-import math
+# pdfgen・platypus・フォント関連のモジュールは読み込みが重いため、
+# 実際にPDFを生成するときに各メソッド内で遅延インポートする
+if TYPE_CHECKING:
+    from reportlab.pdfgen.canvas import Canvas
+
+
+# レイアウト定数（mm→ポイント換算をインポート時に一度だけ行う）
+_MARGIN = 15 * mm  # HTMLの@page marginに合わせる
+_TITLE_OFFSET_X = 6 * mm
+_TITLE_OFFSET_Y = 10 * mm  # 下から10mm（少し上に上げる）
+_HEADER_RIGHT_WIDTH = 90 * mm  # 350px相当
+_SECTION_GAP = 2 * mm
+_RULE_GAP = 1 * mm
+_LABEL_COL_WIDTH = 35 * mm  # 横書きラベル用の幅
+_BODY_AVAILABLE_HEIGHT = 120 * mm
+_BODY_GAP = 3 * mm
+_CHECKLIST_LINE_SPACING = 2 * mm
+_CHECKLIST_CIRCLE_RADIUS = 2 * mm
+_CHECKLIST_PADDING = 3 * mm
+_FOOTER_LINE_GAP = 8 * mm
+_FOOTER_INDENT = 5.3 * mm  # 20px相当
+_FOOTER_SIGN_GAP = 15 * mm
+_DATE_BLANK_WIDTH = 15 * mm  # 空欄の幅
+_NAME_LINE_GAP = 20 * mm
+_NAME_UNDERLINE_WIDTH = 53 * mm  # 200px相当
+_NAME_LABEL_GAP = 10 * mm
+_STAMP_GAP = 5 * mm
+
+# HTMLテンプレートのpx指定をポイントに換算した値（1px = 0.264583mm）
+_PX5 = 5 * 0.264583 * mm
+_PX25 = 25 * 0.264583 * mm
+_PX50 = 50 * 0.264583 * mm
+
+# 曜日の表記（date.weekday()の戻り値順）
+_WEEKDAYS = ("月", "火", "水", "木", "金", "土", "日")
+
+# 原因チェックリストの項目（番号1〜12の順）
+_CAUSE_ITEMS = (
+    "よく見え(聞こえ)なかった",
+    "気が付かなかった",
+    "忘れていた",
+    "知らなかった",
+    "深く考えなかった",
+    "大丈夫だと思った",
+    "あわてていた",
+    "不愉快なことがあった",
+    "疲れていた",
+    "無意識に手が動いた",
+    "やりにくかった",
+    "体のバランスを崩した",
+)
+
+# 分類（category_indexの順）
+_CATEGORIES = (
+    "環境に問題があった",
+    "設備・機器等に問題があった",
+    "指導方法に問題があった",
+    "自分自身に問題があった",
+)
+
+# 本文テーブルの横書きカテゴリのテキスト
+_HORIZONTAL_LABELS = (
+    "事故発生状況と経過",
+    "事故原因",
+    "対　策",
+    "その他",
+)
+
+# 対象者名の区切り文字（改行・カンマ・読点の連続を1つの「、」にまとめる）
+_SUBJECT_SEP_RE = re.compile(r"[\n,、]+")
+
+# 記録日（"2024年01月15日"形式）の年・月・日
+_DATE_RE = re.compile(r"(\d+)\s*年\s*(\d+)\s*月\s*(\d+)")
+
+
+# 明朝体の候補（優先順位順）
+_MINCHO_FONTS = (
+    ("NotoSansJP", "/Library/Fonts/NotoSansJP-VariableFont_wght.ttf"),  # Noto Sans JP（可変フォント）
+    ("HiraginoMincho", "/System/Library/Fonts/ヒラギノ明朝 ProN.ttc"),  # ヒラギノ明朝
+)
+
+# ゴシック体の候補（優先順位順）
+_GOTHIC_FONTS = (
+    ("NotoGothic", "/Library/Fonts/NotoSansJP-VariableFont_wght.ttf"),  # Noto Sans JP（可変フォント）
+    ("HiraginoGothic", "/System/Library/Fonts/ヒラギノ角ゴシック W5.ttc"),  # ヒラギノ角ゴ W5
+    ("HiraginoGothicW3", "/System/Library/Fonts/ヒラギノ角ゴシック W3.ttc"),  # ヒラギノ角ゴ W3
+)
+
+
+def _register_first_available(candidates: Sequence[Tuple[str, str]], registered: Set[str]) -> Optional[str]:
+    """
+    候補の中から最初に利用できるTrueTypeフォントを登録
+    
+    Args:
+        candidates: (フォント名, フォントファイルのパス) のタプルのシーケンス
+        registered: 登録済みのフォント名の集合
+        
+    Returns:
+        str: 登録した（または登録済みだった）フォント名。見つからない場合はNone
+    """
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    
+    for font_name, font_path in candidates:
+        if font_name in registered:
+            return font_name
+        if os.path.exists(font_path):
+            try:
+                # TTCファイルの場合はsubfontIndexを指定
+                if font_path.endswith('.ttc'):
+                    pdfmetrics.registerFont(TTFont(font_name, font_path, subfontIndex=0))
+                else:
+                    pdfmetrics.registerFont(TTFont(font_name, font_path))
+                return font_name
+            except Exception:
+                continue
+    return None
+
+
+def _e(value: Any) -> str:
+    """
+    Paragraphのマークアップに埋め込む値をエスケープ
+    
+    ユーザー入力の「&」「<」「>」がタグとして解釈されないようにする
+    
+    Args:
+        value: 埋め込む値（文字列以外はstrに変換する）
+        
+    Returns:
+        str: エスケープ済みの文字列
+    """
+    return escape(value if isinstance(value, str) else str(value), quote=False)
+
+
+def _stacked_positions(start: float, step: float, count: int) -> Tuple[float, ...]:
+    """
+    上から下へ等間隔に並べる要素のY座標を一括で計算
+    
+    Args:
+        start: 先頭要素のY座標
+        step: 要素間の間隔（下方向を正とする）
+        count: 要素数
+        
+    Returns:
+        tuple: 各要素のY座標
+    """
+    return tuple(start - i * step for i in range(count))
+
+
+@lru_cache(maxsize=128)
+def _sign_area_layout(font_name: str, sign_area_right: float) -> Tuple[Tuple[float, float, float], float, float, float]:
+    """
+    署名欄の定型ラベルの配置を計算（フォント・位置ごとにキャッシュ）
+    
+    Args:
+        font_name: ラベルのフォント名（11pt）
+        sign_area_right: 署名欄の右端のX座標
+        
+    Returns:
+        tuple: (「年」「月」「日」のX座標のタプル, 「氏名」のX座標, 下線の開始X座標, 「印」のX座標)
+    """
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    
+    nen_width = stringWidth("年", font_name, 11)
+    gatsu_width = stringWidth("月", font_name, 11)
+    nichi_width = stringWidth("日", font_name, 11)
+    
+    # 空欄の幅を設定（適切な間隔）
+    blank_width = _DATE_BLANK_WIDTH
+    
+    # 全体の幅を計算（空欄 + 年 + 空欄 + 月 + 空欄 + 日）
+    total_date_width = blank_width + nen_width + blank_width + gatsu_width + blank_width + nichi_width
+    
+    # 右寄せで配置
+    nen_x = sign_area_right - total_date_width + blank_width
+    gatsu_x = nen_x + nen_width + blank_width
+    nichi_x = gatsu_x + gatsu_width + blank_width
+    
+    # 氏名ラベル、下線幅200px = 約53mm、印鑑マーク幅、マージンを考慮
+    name_label_width = stringWidth("氏名", font_name, 11)
+    stamp_width = stringWidth("印", font_name, 11)
+    total_name_width = name_label_width + _NAME_LABEL_GAP + _NAME_UNDERLINE_WIDTH + _STAMP_GAP + stamp_width
+    
+    name_label_x = sign_area_right - total_name_width
+    underline_x = name_label_x + name_label_width + _NAME_LABEL_GAP
+    # 印鑑マーク「印」（下線の右側、margin-left: 5px = 約1.3mm）
+    stamp_x = underline_x + _NAME_UNDERLINE_WIDTH + _STAMP_GAP
+    
+    return (nen_x, gatsu_x, nichi_x), name_label_x, underline_x, stamp_x
+
+
+@dataclass(frozen=True, slots=True)
+class ReportFields:
+    """
+    事故報告書の入力データ
+    
+    generateに渡される辞書を一度だけ正規化し、
+    未指定の項目には既定値を入れた状態で保持する
+    """
+    facility_name: str = ""
+    report_content: str = ""
+    reporter_name: str = ""
+    record_date: str = ""
+    record_date_year: str = ""
+    record_date_month: str = ""
+    record_date_day: str = ""
+    date_year: str = ""
+    date_month: str = ""
+    date_day: str = ""
+    date_weekday: str = ""
+    time_hour: str = ""
+    time_min: str = ""
+    location: str = ""
+    subject_name: str = ""
+    situation: str = ""
+    process: str = ""
+    cause: str = ""
+    cause_indices: Sequence[int] = ()
+    category_index: int = -1
+    category: str = ""
+    countermeasure: str = ""
+    others: str = ""
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReportFields":
+        """
+        辞書からReportFieldsを生成（未知のキーは無視する）
+        
+        Args:
+            data: 事故報告の内容を含む辞書
+            
+        Returns:
+            ReportFields: 正規化された入力データ
+        """
+        return cls(**{key: value for key, value in data.items() if key in _REPORT_FIELD_NAMES})
+
+
+_REPORT_FIELD_NAMES = frozenset(field.name for field in fields(ReportFields))
 
 
 class AccidentReportGenerator:
     """事故報告書PDF生成クラス"""
     
-    def __init__(self, filename="事故報告書.pdf"):
+    # インスタンス属性を固定してインスタンス辞書を持たないようにする
+    # （font_reg/font_boldはクラス属性として共有するため含めない）
+    __slots__ = (
+        "filename", "output",
+        "styles", "para_style", "cause_para_style", "title_style",
+        "label_style", "body_label_style",
+    )
+    
+    # フォント登録状態（クラス全体で共有）
+    _fonts_ready = False
+    _font_lock = threading.Lock()
+    font_reg = "Helvetica"
+    font_bold = "Helvetica-Bold"
+    
+    # ページ寸法（A4は不変のためクラス定数として一度だけ計算）
+    PAGE_W, PAGE_H = A4
+    CONTENT_W = PAGE_W - 2 * _MARGIN
+    CONTENT_H = PAGE_H - 2 * _MARGIN
+    
+    # 本文テーブルの列幅（ラベルカラム: 適切な幅、内容カラム: 残り）
+    # A4に収まるように調整
+    _BODY_COL_WIDTHS = [
+        _LABEL_COL_WIDTH,  # 横書きカテゴリ
+        CONTENT_W - _LABEL_COL_WIDTH - 1.0 * 2,  # 内容（境界線分を引く）
+    ]
+    
+    # 行の高さをA4に収まるように調整（HTMLの比率を維持しつつ縮小）
+    # 利用可能な高さを計算: A4高さ297mm - マージン30mm - ヘッダー約30mm - 情報テーブル約40mm - フッター約50mm = 約147mm
+    # HTMLの比率: 250:150:150:100 = 5:3:3:2
+    # 合計13単位で約120mmに調整
+    _BODY_ROW_HEIGHTS = [
+        _BODY_AVAILABLE_HEIGHT / 13 * 5,  # 事故発生状況と経過
+        _BODY_AVAILABLE_HEIGHT / 13 * 3,  # 事故原因
+        _BODY_AVAILABLE_HEIGHT / 13 * 3,  # 対策
+        _BODY_AVAILABLE_HEIGHT / 13 * 2,  # その他
+    ]
+    
+    # 情報セルの段落テンプレート（ラベル部分はレポートによらず固定、値は_eでエスケープして埋め込む）
+    _TEMPLATES = {
+        "facility_name": '<para leading="13.86"><b>事業所名</b><br/>{}</para>',
+        "report_content": '<para leading="13.86"><b>報告内容</b><br/>{}</para>',
+        "reporter_name": '<para leading="13.86"><b>報告者氏名</b><br/>{}</para>',
+        "record_date": '<para leading="13.86" align="right"><b>記録日</b><br/>{} 年 {} 月 {} 日</para>',
+        "datetime": (
+            '<para leading="13.86"><b>事故発生日時</b><br/>'
+            '{y} 年 {mo} 月 {d} 日<br/>{h} 時 {mi} 分頃<br/>（ {w} ）曜日</para>'
+        ),
+        "location": '<para leading="13.86"><b>発生場所</b><br/>{}</para>',
+        # 対象者名が長い場合や複数の場合に備えて、フォントサイズを少し小さく
+        "subject_name": '<para leading="12"><b>対象者</b><br/><font size="10">{}</font></para>',
+    }
+    
+    # 原因チェックリストの配置（チェックリスト欄の左上を原点とする相対座標）
+    _CHECKLIST_FONT_SIZE = 11
+    _CHECKLIST_FONT_HEIGHT = _CHECKLIST_FONT_SIZE * 1.4
+    # 「該当する事項に○をつける」の説明文（上端からパディング6pt）
+    _CHECKLIST_INSTRUCTION_Y = -6 - _CHECKLIST_PADDING
+    # 選択肢1のY位置（説明文の下に少し余裕を持たせ、さらに少し下げる）
+    _CHECKLIST_FIRST_Y = (
+        _CHECKLIST_INSTRUCTION_Y - _CHECKLIST_FONT_HEIGHT
+        - _CHECKLIST_LINE_SPACING - _CHECKLIST_PADDING - _CHECKLIST_PADDING
+    )
+    # 選択肢12のY位置（パディング6ptを考慮し、少し上げる）
+    _CHECKLIST_LAST_Y = 6 + _CHECKLIST_PADDING
+    # 各項目のY位置（選択肢1と12の間の11個の間隔で均等に配置）と円の中心のY位置
+    _CHECKLIST_ITEM_SPACING = (_CHECKLIST_FIRST_Y - _CHECKLIST_LAST_Y) / 11
+    _CHECKLIST_ITEM_YS = _stacked_positions(_CHECKLIST_FIRST_Y, _CHECKLIST_ITEM_SPACING, len(_CAUSE_ITEMS))
+    _CHECKLIST_CIRCLE_YS = _stacked_positions(
+        _CHECKLIST_FIRST_Y + _CHECKLIST_FONT_HEIGHT * 0.5, _CHECKLIST_ITEM_SPACING, len(_CAUSE_ITEMS)
+    )
+    # 番号の右端（幅25px）、円（番号の後、margin-right: 5px）、
+    # テキスト（円の後、margin-right: 5px）のX位置は全項目で共通
+    _CHECKLIST_NUM_RIGHT_X = _PX25
+    _CHECKLIST_CIRCLE_X = _PX25 + _PX5 + _CHECKLIST_CIRCLE_RADIUS
+    _CHECKLIST_TEXT_X = _CHECKLIST_CIRCLE_X + _CHECKLIST_CIRCLE_RADIUS + _PX5
+    
+    # 事業所名・管理者テーブルの列幅と高さ
+    _HEADER_COL_WIDTHS = [
+        _HEADER_RIGHT_WIDTH * 0.65,  # 事業所名 65%（バランス調整）
+        _HEADER_RIGHT_WIDTH * 0.35,  # 管理者 35%（少し広げる）
+    ]
+    _HEADER_HEIGHT = _PX50  # 50px高さ
+    
+    # 定型部分のフォームXObjectの名前
+    _HEADER_FORM_NAME = "accident_header"
+    _CHECKLIST_FORM_NAME = "accident_checklist"
+    _FOOTER_FORM_NAME = "accident_footer"
+    
+    # テーブルスタイル（データに依存しないため初回のPDF生成時に一度だけ構築）
+    _header_right_style = None
+    _info_row1_style = None
+    _info_row2_style = None
+    _body_table_style = None
+    _manager_cell_style = None
+    
+    # 固定文字列の描画幅キャッシュ（(文字列, フォント名, サイズ) -> 幅）
+    _WIDTH_CACHE: Dict[Tuple[str, str, float], float] = {}
+    
+    # 段落スタイルと本文テーブルのラベル段落（フォント登録後に一度だけ構築し、全インスタンスで共有）
+    _sample_styles = None
+    _paragraph_styles = None
+    _body_label_paragraphs: Tuple[Any, ...] = ()
+    
+    # 分類
+    categories = _CATEGORIES
+    
+    def __init__(self, filename: str = "事故報告書.pdf", output: Optional[IO[bytes]] = None):
         """
         初期化
         
         Args:
             filename: 生成するPDFファイル名
+            output: PDFの出力先となるファイルライクオブジェクト（BytesIOなど）。
+                指定した場合はfilenameの代わりにこちらへ書き込む
         """
         self.filename = filename
-        self.width, self.height = A4
-        self.margin = 15 * mm  # HTMLの@page marginに合わせる
-        
-        # 日本語フォントの登録
-        # macOSの標準日本語フォントを使用
-        font_registered = False
-        
-        # 明朝体の登録（優先順位順）
-        mincho_fonts = [
-            ("NotoSansJP", "/Library/Fonts/NotoSansJP-VariableFont_wght.ttf"),  # Noto Sans JP（可変フォント）
-            ("HiraginoMincho", "/System/Library/Fonts/ヒラギノ明朝 ProN.ttc"),  # ヒラギノ明朝
-        ]
-        
-        # ゴシック体の登録（優先順位順）
-        gothic_fonts = [
-            ("NotoGothic", "/Library/Fonts/NotoSansJP-VariableFont_wght.ttf"),  # Noto Sans JP（可変フォント）
-            ("HiraginoGothic", "/System/Library/Fonts/ヒラギノ角ゴシック W5.ttc"),  # ヒラギノ角ゴ W5
-            ("HiraginoGothicW3", "/System/Library/Fonts/ヒラギノ角ゴシック W3.ttc"),  # ヒラギノ角ゴ W3
-        ]
+        self.output = output
         
-        # 明朝体の登録
-        for font_name, font_path in mincho_fonts:
-            if os.path.exists(font_path):
-                try:
-                    # TTCファイルの場合はsubfontIndexを指定
-                    if font_path.endswith('.ttc'):
-                        pdfmetrics.registerFont(TTFont(font_name, font_path, subfontIndex=0))
-                    else:
-                        pdfmetrics.registerFont(TTFont(font_name, font_path))
-                    self.font_reg = font_name
-                    font_registered = True
-                    break
-                except Exception as e:
-                    continue
+        # フォントの登録とスタイルの準備は、実際にPDFを生成するまで遅延する
+        # （日付の整形だけに使う場合などはフォントを読み込まない）
+    
+    @classmethod
+    def _ensure_fonts_registered(cls):
+        """
+        日本語フォントを登録する（プロセス内で一度だけ実行）
         
-        # ゴシック体の登録
-        for font_name, font_path in gothic_fonts:
-            if os.path.exists(font_path):
+        pdfmetricsへの登録はプロセス全体で共有されるため、
+        2回目以降はフォントの探索・登録を省略する
+        """
+        if cls._fonts_ready:
+            return
+        with cls._font_lock:
+            if cls._fonts_ready:
+                return
+            from reportlab.pdfbase import pdfmetrics
+            from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+            
+            # 他の生成クラスなどで登録済みのフォントは再登録しない
+            registered = set(pdfmetrics.getRegisteredFontNames())
+            
+            # macOSの標準日本語フォントを使用
+            font_reg = _register_first_available(_MINCHO_FONTS, registered)
+            font_bold = _register_first_available(_GOTHIC_FONTS, registered)
+            font_registered = font_reg is not None
+            if font_reg is not None:
+                cls.font_reg = font_reg
+            if font_bold is not None:
+                cls.font_bold = font_bold
+            
+            # フォント登録に失敗した場合のフォールバック
+            if not font_registered:
                 try:
-                    # TTCファイルの場合はsubfontIndexを指定
-                    if font_path.endswith('.ttc'):
-                        pdfmetrics.registerFont(TTFont(font_name, font_path, subfontIndex=0))
-                    else:
-                        pdfmetrics.registerFont(TTFont(font_name, font_path))
-                    self.font_bold = font_name
-                    break
-                except Exception as e:
-                    continue
+                    # UnicodeCIDFontを試す（Adobe Acrobatフォントがある場合）
+                    for cid_font in ("HeiseiMin-W3-Acro", "HeiseiKakuGo-W5-Acro"):
+                        if cid_font not in registered:
+                            pdfmetrics.registerFont(UnicodeCIDFont(cid_font))
+                    cls.font_reg = "HeiseiMin-W3-Acro"
+                    cls.font_bold = "HeiseiKakuGo-W5-Acro"
+                except (KeyError, OSError):
+                    # CIDフォントの定義やCMapが見つからない場合
+                    # 最終的なフォールバック
+                    cls.font_reg = "Helvetica"
+                    cls.font_bold = "Helvetica-Bold"
+            
+            cls._fonts_ready = True
+    
+    @classmethod
+    def _ensure_table_styles(cls):
+        """データに依存しないテーブルスタイルを一度だけ構築"""
+        if cls._body_table_style is not None:
+            return
+        from reportlab.lib import colors
+        from reportlab.platypus import TableStyle
+        
+        # 事業所名・管理者テーブル
+        cls._header_right_style = TableStyle([
+            ('GRID', (0, 0), (-1, -1), 1.0, colors.black),  # 内側は1px
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+            ('ALIGN', (1, 0), (1, 0), 'LEFT'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 6),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            # 外枠を太く（上と右）
+            ('LINEABOVE', (0, 0), (-1, 0), 2.0, colors.black),
+            ('LINEAFTER', (-1, 0), (-1, 0), 2.0, colors.black),
+        ])
         
-        # フォント登録に失敗した場合のフォールバック
-        if not font_registered:
-            try:
-                # UnicodeCIDFontを試す（Adobe Acrobatフォントがある場合）
-                pdfmetrics.registerFont(UnicodeCIDFont("HeiseiMin-W3-Acro"))
-                pdfmetrics.registerFont(UnicodeCIDFont("HeiseiKakuGo-W5-Acro"))
-                self.font_reg = "HeiseiMin-W3-Acro"
-                self.font_bold = "HeiseiKakuGo-W5-Acro"
-            except Exception:
-                # 最終的なフォールバック
-                self.font_reg = "Helvetica"
-                self.font_bold = "Helvetica-Bold"
+        # 管理者セル内の入れ子テーブル（「管理者」は左上、「㊞」は右下）
+        cls._manager_cell_style = TableStyle([
+            ('FONT', (0, 0), (0, 0), cls.font_bold, 9),  # 9pt
+            ('FONT', (0, 1), (0, 1), cls.font_reg, 12),  # 12pt（小さく調整）
+            ('VALIGN', (0, 0), (0, 0), 'TOP'),
+            ('VALIGN', (0, 1), (0, 1), 'BOTTOM'),
+            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+            ('ALIGN', (0, 1), (0, 1), 'RIGHT'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+            ('TOPPADDING', (0, 0), (-1, -1), 0),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+        ])
         
-        # スタイルシートの準備
-        self.styles = getSampleStyleSheet()
-        self.setup_custom_styles()
+        # 情報テーブル（第1行：報告内容、報告者氏名、記録日）
+        cls._info_row1_style = TableStyle([
+            ('GRID', (0, 0), (-1, -1), 1.0, colors.black),  # 内側は1px
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('ALIGN', (0, 0), (1, 0), 'LEFT'),  # 報告内容、報告者氏名は左
+            ('ALIGN', (2, 0), (2, 0), 'RIGHT'),  # 記録日は右
+            ('LEFTPADDING', (0, 0), (-1, -1), 6),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            # 外枠を太く（左と右）
+            ('LINEBEFORE', (0, 0), (0, 0), 2.0, colors.black),
+            ('LINEAFTER', (-1, 0), (-1, 0), 2.0, colors.black),
+        ])
         
-        # 原因チェックリスト
-        self.cause_items = {
-            1: "よく見え(聞こえ)なかった",
-            2: "気が付かなかった",
-            3: "忘れていた",
-            4: "知らなかった",
-            5: "深く考えなかった",
-            6: "大丈夫だと思った",
-            7: "あわてていた",
-            8: "不愉快なことがあった",
-            9: "疲れていた",
-            10: "無意識に手が動いた",
-            11: "やりにくかった",
-            12: "体のバランスを崩した"
-        }
+        # 情報テーブル（第2行：事故発生日時、発生場所、対象者）
+        cls._info_row2_style = TableStyle([
+            ('GRID', (0, 0), (-1, -1), 1.0, colors.black),  # 内側は1px
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 6),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            # 外枠を太く（左、右、下）
+            ('LINEBEFORE', (0, 0), (0, 0), 2.0, colors.black),
+            ('LINEAFTER', (-1, 0), (-1, 0), 2.0, colors.black),
+            ('LINEBELOW', (0, 0), (-1, 0), 2.0, colors.black),
+        ])
         
-        # 分類
-        self.categories = [
-            "環境に問題があった",
-            "設備・機器等に問題があった",
-            "指導方法に問題があった",
-            "自分自身に問題があった"
-        ]
+        # 本文テーブル
+        cls._body_table_style = TableStyle([
+            ('GRID', (0, 0), (-1, -1), 1.0, colors.black),  # 内側は1px
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ALIGN', (0, 0), (0, -1), 'CENTER'),  # ラベルカラム中央
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),    # 内容左
+            ('LEFTPADDING', (0, 0), (-1, -1), 6),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('LEFTPADDING', (1, 0), (1, -1), 6),
+            ('RIGHTPADDING', (1, 0), (1, -1), 6),
+            ('TOPPADDING', (1, 0), (1, -1), 6),
+            ('BOTTOMPADDING', (1, 0), (1, -1), 6),
+            # 外枠を太く（左、右、下）
+            ('LINEBEFORE', (0, 0), (0, -1), 2.0, colors.black),
+            ('LINEAFTER', (-1, 0), (-1, -1), 2.0, colors.black),
+            ('LINEBELOW', (0, -1), (-1, -1), 2.0, colors.black),
+        ])
     
-    def setup_custom_styles(self):
-        """カスタムスタイルの設定"""
+    @classmethod
+    def _ensure_paragraph_styles(cls):
+        """段落スタイルを一度だけ構築（フォント登録後に呼び出す）"""
+        if cls._paragraph_styles is not None:
+            return
+        from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+        from reportlab.lib.enums import TA_CENTER, TA_LEFT
+        from reportlab.platypus import Paragraph
+        
+        styles = getSampleStyleSheet()
+        
         # 本文用スタイル（11pt、明朝体）
-        self.para_style = ParagraphStyle(
+        para_style = ParagraphStyle(
             'CustomBody',
-            parent=self.styles['Normal'],
-            fontName=self.font_reg,
+            parent=styles['Normal'],
+            fontName=cls.font_reg,
             fontSize=11,
             leading=15.4,  # line-height: 1.4
             alignment=TA_LEFT,
@@ -146,11 +546,18 @@ class AccidentReportGenerator:
             wordWrap='CJK',  # 日本語の自動折り返しを有効化
         )
         
+        # 原因テキスト用スタイル（右40%をチェックリスト用に空ける）
+        cause_para_style = ParagraphStyle(
+            'CauseBody',
+            parent=para_style,
+            rightIndent=cls._BODY_COL_WIDTHS[1] * 0.40 - 6 * 2,  # セルの左右パディング分を差し引く
+        )
+        
         # タイトル用スタイル
-        self.title_style = ParagraphStyle(
+        title_style = ParagraphStyle(
             'CustomTitle',
-            parent=self.styles['Normal'],
-            fontName=self.font_bold,
+            parent=styles['Normal'],
+            fontName=cls.font_bold,
             fontSize=16.5,  # 1.5em = 11pt * 1.5
             leading=23.1,
             alignment=TA_CENTER,
@@ -158,10 +565,10 @@ class AccidentReportGenerator:
         )
         
         # ラベル用スタイル（0.9em = 9.9pt）
-        self.label_style = ParagraphStyle(
+        label_style = ParagraphStyle(
             'CustomLabel',
-            parent=self.styles['Normal'],
-            fontName=self.font_bold,
+            parent=styles['Normal'],
+            fontName=cls.font_bold,
             fontSize=9.9,
             leading=13.86,
             alignment=TA_LEFT,
@@ -169,10 +576,10 @@ class AccidentReportGenerator:
         )
         
         # 本文テーブルのラベル用スタイル（横書き、太字、中央揃え）
-        self.body_label_style = ParagraphStyle(
+        body_label_style = ParagraphStyle(
             'BodyLabel',
-            parent=self.styles['Normal'],
-            fontName=self.font_bold,
+            parent=styles['Normal'],
+            fontName=cls.font_bold,
             fontSize=11,
             leading=15.4,
             alignment=TA_CENTER,
@@ -180,6 +587,49 @@ class AccidentReportGenerator:
             spaceAfter=0,
             wordWrap='CJK',  # 日本語の自動折り返しを有効化（はみ出し防止）
         )
+        
+        cls._body_label_paragraphs = tuple(Paragraph(label, body_label_style) for label in _HORIZONTAL_LABELS)
+        cls._sample_styles = styles
+        cls._paragraph_styles = {
+            "body": para_style,
+            "cause": cause_para_style,
+            "title": title_style,
+            "label": label_style,
+            "body_label": body_label_style,
+        }
+    
+    def setup_custom_styles(self):
+        """カスタムスタイルの設定"""
+        # 日本語フォントの登録（プロセス内で一度だけ実行）
+        self._ensure_fonts_registered()
+        self._ensure_paragraph_styles()
+        styles = self._paragraph_styles
+        self.styles = self._sample_styles
+        self.para_style = styles["body"]
+        self.cause_para_style = styles["cause"]
+        self.title_style = styles["title"]
+        self.label_style = styles["label"]
+        self.body_label_style = styles["body_label"]
+    
+    @classmethod
+    def _sw(cls, text: str, font_name: str, font_size: float) -> float:
+        """
+        文字列の描画幅を取得（フォントとサイズごとにキャッシュ）
+        
+        Args:
+            text: 幅を測る文字列
+            font_name: フォント名
+            font_size: フォントサイズ
+            
+        Returns:
+            float: 描画幅（ポイント）
+        """
+        key = (text, font_name, font_size)
+        width = cls._WIDTH_CACHE.get(key)
+        if width is None:
+            from reportlab.pdfbase.pdfmetrics import stringWidth
+            width = cls._WIDTH_CACHE[key] = stringWidth(text, font_name, font_size)
+        return width
     
     def draw_vertical_text(self, canvas_obj, text, x, y, width, height, font_name, font_size):
         """
@@ -201,7 +651,7 @@ class AccidentReportGenerator:
         center_y = y + height / 2
         
         # 文字間隔を計算（letter-spacing: 5px、HTMLテンプレートに合わせる）
-        char_spacing = 5 * 0.264583 * mm  # 5pxをmmに変換
+        char_spacing = _PX5
         
         # テキストの総高さを計算
         total_height = len(text) * (font_size + char_spacing) - char_spacing
@@ -209,18 +659,16 @@ class AccidentReportGenerator:
         # 開始位置を計算（中央から上に）
         start_y = center_y + total_height / 2 - font_size
         
-        # 各文字を縦に配置
-        for i, char in enumerate(text):
-            char_y = start_y - i * (font_size + char_spacing)
-            # 文字を回転させて描画
-            canvas_obj.saveState()
-            canvas_obj.translate(center_x, char_y)
-            canvas_obj.rotate(90)
-            canvas_obj.setFont(font_name, font_size)
-            # 文字の中央揃えのため、文字幅の半分だけ左にずらす
-            char_width = canvas_obj.stringWidth(char, font_name, font_size)
-            canvas_obj.drawString(-char_width / 2, 0, char)
-            canvas_obj.restoreState()
+        # 1つのテキストオブジェクトにまとめ、90度回転したテキスト行列で各文字を縦に配置
+        tx = canvas_obj.beginText()
+        tx.setFont(font_name, font_size)
+        char_ys = _stacked_positions(start_y, font_size + char_spacing, len(text))
+        for char, char_y in zip(text, char_ys):
+            # 文字の中央揃えのため、文字幅の半分だけ下（回転後の左）にずらす
+            char_width = self._sw(char, font_name, font_size)
+            tx.setTextTransform(0, 1, -1, 0, center_x, char_y - char_width / 2)
+            tx.textOut(char)
+        canvas_obj.drawText(tx)
         
         canvas_obj.restoreState()
     
@@ -249,7 +697,149 @@ class AccidentReportGenerator:
         canvas_obj.setLineWidth(line_width)
         canvas_obj.line(x, y, x + width, y)
     
-    def generate(self, data):
+    def _build_header_form(self, c: "Canvas") -> None:
+        """
+        ヘッダーの定型部分をフォームXObjectとして定義
+        
+        タイトルとタイトル下の太線はデータに依存しないため、
+        フォームとして一度だけ描画し、doFormで配置する。
+        事業所名・管理者テーブルの高さは固定のため、座標はページ座標のままとする。
+        
+        Args:
+            c: Canvasオブジェクト
+        """
+        c.beginForm(self._HEADER_FORM_NAME, lowerx=0, lowery=0, upperx=self.PAGE_W, uppery=self.PAGE_H)
+        top_y = self.PAGE_H - _MARGIN
+        header_y = top_y - self._HEADER_HEIGHT
+        
+        # タイトルを描画（左側、下揃え）
+        c.setFont(self.font_bold, 20)  # 20pt
+        c.drawString(_MARGIN + _TITLE_OFFSET_X, top_y - _TITLE_OFFSET_Y, "事故状況・対策報告書")
+        
+        # タイトル下の太い線（2px）を描画
+        line_y = header_y - _SECTION_GAP
+        c.setLineWidth(2.0)
+        c.line(_MARGIN, line_y, _MARGIN + self.CONTENT_W, line_y)
+        
+        c.endForm()
+    
+    def _build_checklist_form(self, c: "Canvas") -> None:
+        """
+        選択前の原因チェックリストをフォームXObjectとして定義
+        
+        説明文、番号、項目名、輪郭のみの円はデータに依存しないため、
+        フォームとして一度だけ描画し、doFormで配置する。
+        座標はチェックリスト欄の左上を原点とする。
+        
+        Args:
+            c: Canvasオブジェクト
+        """
+        from reportlab.lib import colors
+        
+        font_reg = self.font_reg
+        font_size_pt = self._CHECKLIST_FONT_SIZE
+        
+        # フォームの範囲外は切り取られるため、文字の高さ分の余裕を持たせる
+        ys = self._CHECKLIST_ITEM_YS + self._CHECKLIST_CIRCLE_YS + (self._CHECKLIST_INSTRUCTION_Y,)
+        c.beginForm(
+            self._CHECKLIST_FORM_NAME,
+            lowerx=0, lowery=min(ys) - self._CHECKLIST_FONT_HEIGHT,
+            upperx=self.CONTENT_W, uppery=max(ys) + self._CHECKLIST_FONT_HEIGHT,
+        )
+        
+        # 輪郭の円を描画
+        c.setStrokeColor(colors.HexColor('#333333'))
+        c.setLineWidth(1)
+        for circle_y in self._CHECKLIST_CIRCLE_YS:
+            c.circle(self._CHECKLIST_CIRCLE_X, circle_y, _CHECKLIST_CIRCLE_RADIUS, fill=0)
+        
+        # 文字は1つのテキストオブジェクトにまとめて描画する
+        tx = c.beginText()
+        
+        # 「該当する事項に○をつける」の説明文を描画
+        tx.setFont(font_reg, 10)
+        tx.setTextOrigin(0, self._CHECKLIST_INSTRUCTION_Y)
+        tx.textOut("該当する事項に○をつける")
+        
+        # 各チェックリスト項目の番号（右寄せ）とテキストを描画
+        tx.setFont(font_reg, font_size_pt)
+        for i, (item_y, label) in enumerate(zip(self._CHECKLIST_ITEM_YS, _CAUSE_ITEMS), 1):
+            num_text = str(i)
+            num_width = self._sw(num_text, font_reg, font_size_pt)
+            tx.setTextOrigin(self._CHECKLIST_NUM_RIGHT_X - num_width, item_y)
+            tx.textOut(num_text)
+            tx.setTextOrigin(self._CHECKLIST_TEXT_X, item_y)
+            tx.textOut(label)
+        c.drawText(tx)
+        
+        c.endForm()
+    
+    def _build_footer_form(self, c: "Canvas", width: float) -> None:
+        """
+        署名欄（フッター）をフォームXObjectとして定義
+        
+        フッターはデータに依存しない定型部分のみで構成されるため、
+        フォームとして一度だけ描画し、doFormで配置する。
+        座標は説明文のベースライン左端を原点とする。
+        
+        Args:
+            c: Canvasオブジェクト
+            width: フッターの幅（本文の幅）
+        """
+        depth = _FOOTER_LINE_GAP * 2 + _FOOTER_SIGN_GAP + _NAME_LINE_GAP
+        c.beginForm(self._FOOTER_FORM_NAME, lowerx=0, lowery=-depth, upperx=width, uppery=_FOOTER_LINE_GAP)
+        footer_y = 0
+        
+        # 文字は1つのテキストオブジェクトにまとめて描画する
+        tx = c.beginText()
+        
+        # 説明文（10pt）
+        tx.setFont(self.font_reg, 10)
+        tx.setTextOrigin(0, footer_y)
+        tx.textOut("（説明が必要な場合に署名・捺印を頂きます）")
+        
+        footer_y -= _FOOTER_LINE_GAP
+        
+        # 確認文（14pt、左マージン20px = 約5.3mm）
+        tx.setFont(self.font_reg, 14)
+        tx.setTextOrigin(_FOOTER_INDENT, footer_y)
+        tx.textOut("上記について、説明を受けました。")
+        
+        footer_y -= _FOOTER_SIGN_GAP
+        
+        # 署名欄（HTMLでは右寄せ、margin-right: 20px）
+        sign_area_y = footer_y
+        tx.setFont(self.font_reg, 11)
+        right_margin = _FOOTER_INDENT
+        sign_area_right = width - right_margin
+        
+        # 日付欄と氏名欄の配置（フォントごとに一度だけ計算）
+        date_xs, name_label_x, underline_x, stamp_x = _sign_area_layout(self.font_reg, sign_area_right)
+        
+        # 日付欄（右寄せ、空欄で「年　　月　　日」のみ表示）
+        for x_pos, label in zip(date_xs, ("年", "月", "日")):
+            tx.setTextOrigin(x_pos, sign_area_y)
+            tx.textOut(label)
+        
+        # 改行後の氏名欄（右寄せ、line-height: 2.5相当）
+        sign_area_y -= _NAME_LINE_GAP
+        
+        # 氏名ラベル
+        tx.setTextOrigin(name_label_x, sign_area_y)
+        tx.textOut("氏名")
+        
+        # 氏名の下線（200px = 約53mm）
+        c.setLineWidth(0.5)
+        c.line(underline_x, sign_area_y - 2, underline_x + _NAME_UNDERLINE_WIDTH, sign_area_y - 2)
+        
+        # 印鑑マーク「印」（下線の右側）
+        tx.setTextOrigin(stamp_x, sign_area_y)
+        tx.textOut("印")
+        c.drawText(tx)
+        
+        c.endForm()
+    
+    def generate(self, data: Dict[str, Any]) -> Union[str, IO[bytes]]:
         """
         AIが生成したデータを受け取りPDFを作成する
         
@@ -272,124 +862,88 @@ class AccidentReportGenerator:
                 - others: その他
                 - reporter_name: 報告者氏名
                 - record_date_year, record_date_month, record_date_day: 記録日（年、月、日）
+        
+        Returns:
+            出力先（outputを指定した場合はそのオブジェクト、それ以外はファイル名）
         """
-        c = canvas.Canvas(self.filename, pagesize=A4)
+        # 入力データを一度だけ正規化（未指定の項目は既定値になる）
+        f = ReportFields.from_dict(data)
+        
+        from reportlab.pdfgen import canvas
+        from reportlab.platypus import Table, Paragraph
+        from reportlab.lib import colors
+        self.setup_custom_styles()
+        self._ensure_table_styles()
+        
+        # 出力先（ストリームが指定されていればディスクを経由しない）
+        target = self.output if self.output is not None else self.filename
+        # コンテンツストリームを圧縮し、乱数IDを使わない決定的な出力にする
+        c = canvas.Canvas(target, pagesize=A4, pageCompression=1, invariant=1)
         c.setTitle("事故状況・対策報告書")
         
         # ページマージンの設定
-        content_width = self.width - 2 * self.margin
-        content_height = self.height - 2 * self.margin
-        start_x = self.margin
-        start_y = self.height - self.margin
+        content_width = self.CONTENT_W
+        content_height = self.CONTENT_H
+        start_x = _MARGIN
+        start_y = self.PAGE_H - _MARGIN
         
         # 現在のY位置を追跡
         current_y = start_y
         
         # ===== ヘッダー部分 =====
         # タイトル（左側）と事業所名・管理者（右側テーブル）を横並び
-        px_to_mm = 0.264583
-        
-        # タイトルを描画（左側、下揃え）
-        c.setFont(self.font_bold, 20)  # 20pt
-        title_text = "事故状況・対策報告書"
-        title_y = current_y - 10 * mm  # 下から10mm（少し上に上げる）
-        c.drawString(start_x + 6 * mm, title_y, title_text)
-        
         # 右側のテーブル（事業所名と管理者）
-        right_table_width = 90 * mm  # 350px相当
+        right_table_width = _HEADER_RIGHT_WIDTH
         right_table_x = start_x + content_width - right_table_width
         
         # 事業所名と管理者のテーブル
         header_right_data = [
             [
                 Paragraph(
-                    f'<para leading="13.86"><b>事業所名</b><br/>{data.get("facility_name", "")}</para>',
+                    self._TEMPLATES["facility_name"].format(_e(f.facility_name)),
                     self.para_style
                 ),
-                ""  # 管理者セルは後で手動描画
+                # 管理者セル（左上に「管理者」、右下に「㊞」）
+                Table(
+                    [["管理者"], ["㊞"]],
+                    colWidths=[self._HEADER_COL_WIDTHS[1] - 6 * 2],  # セルの左右パディング分を差し引く
+                    rowHeights=[(self._HEADER_HEIGHT - 6 * 2) / 2] * 2,  # セルの上下パディング分を差し引く
+                    style=self._manager_cell_style,
+                ),
             ]
         ]
         
-        header_right_col_widths = [
-            right_table_width * 0.65,  # 事業所名 65%（バランス調整）
-            right_table_width * 0.35,  # 管理者 35%（少し広げる）
-        ]
-        
         header_right_table = Table(
             header_right_data,
-            colWidths=header_right_col_widths,
-            rowHeights=[50 * px_to_mm * mm]  # 50px高さ
+            colWidths=self._HEADER_COL_WIDTHS,
+            rowHeights=[self._HEADER_HEIGHT]
         )
         
-        header_right_style = TableStyle([
-            ('GRID', (0, 0), (-1, -1), 1.0, colors.black),  # 内側は1px
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-            ('ALIGN', (1, 0), (1, 0), 'LEFT'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            # 外枠を太く（上と右）
-            ('LINEABOVE', (0, 0), (-1, 0), 2.0, colors.black),
-            ('LINEAFTER', (-1, 0), (-1, 0), 2.0, colors.black),
-        ])
-        
-        header_right_table.setStyle(header_right_style)
-        header_right_w, header_right_h = header_right_table.wrapOn(c, right_table_width, content_height)
-        header_right_y = current_y - header_right_h
-        header_right_table.drawOn(c, right_table_x, header_right_y)
-        
-        # 管理者セルに「管理者」と「㊞」を手動描画
-        manager_cell_x = right_table_x + header_right_col_widths[0] + 1.0
-        manager_cell_y = header_right_y
-        manager_cell_width = header_right_col_widths[1] - 1.0 * 2
-        manager_cell_height = header_right_h - 1.0 * 2
-        
-        # 左上に「管理者」を描画
-        c.setFont(self.font_bold, 9)  # 9pt
-        manager_label_x = manager_cell_x + 6
-        manager_label_y = header_right_y + manager_cell_height - 6
-        c.drawString(manager_label_x, manager_label_y, "管理者")
-        
-        # 右下に「㊞」を描画（フォントサイズを小さく）
-        c.setFont(self.font_reg, 12)  # 12pt（小さく調整）
-        stamp_text = "㊞"
-        stamp_width = c.stringWidth(stamp_text, self.font_reg, 12)
-        stamp_x = manager_cell_x + manager_cell_width - stamp_width - 5
-        stamp_y = manager_cell_y + 5
-        c.drawString(stamp_x, stamp_y, stamp_text)
+        header_right_table.setStyle(self._header_right_style)
+        header_right_table.wrapOn(c, right_table_width, content_height)
+        header_right_table.drawOn(c, right_table_x, current_y - self._HEADER_HEIGHT)
         
-        # タイトル下の太い線（2px）を描画
-        line_y = current_y - header_right_h - 2 * mm
-        c.setLineWidth(2.0)
-        c.line(start_x, line_y, start_x + content_width, line_y)
+        # タイトル・タイトル下の太線（定型部分）
+        self._build_header_form(c)
+        c.doForm(self._HEADER_FORM_NAME)
         
         # マージンを調整（A4に収まるように）
-        current_y = line_y - 1 * mm
+        current_y -= self._HEADER_HEIGHT + _SECTION_GAP + _RULE_GAP
         
         # ===== 情報テーブル（第1行） =====
         # 報告内容、報告者氏名、記録日
-        record_date_year = data.get("record_date_year", "")
-        record_date_month = data.get("record_date_month", "")
-        record_date_day = data.get("record_date_day", "")
-        
         # 記録日が文字列の場合、パースを試みる
-        if not record_date_year and data.get("record_date"):
-            try:
-                # "2024年01月15日"形式から抽出
-                date_str = data.get("record_date", "")
-                if "年" in date_str:
-                    parts = date_str.replace("年", " ").replace("月", " ").replace("日", "").split()
-                    if len(parts) >= 3:
-                        record_date_year = parts[0]
-                        record_date_month = parts[1]
-                        record_date_day = parts[2]
-            except:
-                pass
+        record_date_year = f.record_date_year
+        record_date_month = f.record_date_month
+        record_date_day = f.record_date_day
+        if not record_date_year and f.record_date:
+            # "2024年01月15日"形式から抽出
+            m = _DATE_RE.search(f.record_date)
+            if m:
+                record_date_year, record_date_month, record_date_day = m.groups()
         
         # 報告内容が指定されていない場合は空文字列
-        report_content = data.get("report_content", "")
+        report_content = f.report_content
         if not report_content:
             # situationから簡潔に抽出するか、空のまま
             report_content = ""
@@ -397,15 +951,17 @@ class AccidentReportGenerator:
         info_row1_data = [
             [
                 Paragraph(
-                    f'<para leading="13.86"><b>報告内容</b><br/>{report_content}</para>',
+                    self._TEMPLATES["report_content"].format(_e(report_content)),
                     self.para_style
                 ),
                 Paragraph(
-                    f'<para leading="13.86"><b>報告者氏名</b><br/>{data.get("reporter_name", "")}</para>',
+                    self._TEMPLATES["reporter_name"].format(_e(f.reporter_name)),
                     self.para_style
                 ),
                 Paragraph(
-                    f'<para leading="13.86" align="right"><b>記録日</b><br/>{record_date_year} 年 {record_date_month} 月 {record_date_day} 日</para>',
+                    self._TEMPLATES["record_date"].format(
+                        _e(record_date_year), _e(record_date_month), _e(record_date_day)
+                    ),
                     self.para_style
                 )
             ]
@@ -423,67 +979,47 @@ class AccidentReportGenerator:
             rowHeights=[None]  # 自動調整
         )
         
-        info_row1_style = TableStyle([
-            ('GRID', (0, 0), (-1, -1), 1.0, colors.black),  # 内側は1px
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('ALIGN', (0, 0), (1, 0), 'LEFT'),  # 報告内容、報告者氏名は左
-            ('ALIGN', (2, 0), (2, 0), 'RIGHT'),  # 記録日は右
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            # 外枠を太く（左と右）
-            ('LINEBEFORE', (0, 0), (0, 0), 2.0, colors.black),
-            ('LINEAFTER', (-1, 0), (-1, 0), 2.0, colors.black),
-        ])
-        
-        info_row1_table.setStyle(info_row1_style)
+        info_row1_table.setStyle(self._info_row1_style)
         info_row1_w, info_row1_h = info_row1_table.wrapOn(c, content_width, content_height)
         info_row1_table.drawOn(c, start_x, current_y - info_row1_h)
         # マージンを調整（A4に収まるように）
-        current_y -= info_row1_h + 2 * mm
+        current_y -= info_row1_h + _SECTION_GAP
         
         # ===== 情報テーブル（第2行） =====
         # 事故発生日時、発生場所、対象者
-        date_year = data.get("date_year", "")
-        date_month = data.get("date_month", "")
-        date_day = data.get("date_day", "")
-        time_hour = data.get("time_hour", "")
-        time_min = data.get("time_min", "")
-        date_weekday = data.get("date_weekday", "")
-        
-        # 分を2桁表示に変換
-        try:
-            time_min_formatted = str(int(time_min)).zfill(2) if time_min else ""
-        except (ValueError, TypeError):
-            time_min_formatted = str(time_min).zfill(2) if time_min else ""
+        # 分を2桁表示に変換（数字以外はそのまま2桁に埋める）
+        time_min = f.time_min
+        if not time_min:
+            time_min_formatted = ""
+        elif isinstance(time_min, (int, float)):
+            time_min_formatted = f"{int(time_min):02d}"
+        else:
+            time_min_str = str(time_min)
+            digits = time_min_str.strip()
+            time_min_formatted = f"{int(digits):02d}" if digits.isdecimal() else time_min_str.zfill(2)
         
-        datetime_text = f'<para leading="13.86"><b>事故発生日時</b><br/>{date_year} 年 {date_month} 月 {date_day} 日<br/>{time_hour} 時 {time_min_formatted} 分頃<br/>（ {date_weekday} ）曜日</para>'
+        datetime_text = self._TEMPLATES["datetime"].format(
+            y=_e(f.date_year), mo=_e(f.date_month), d=_e(f.date_day),
+            h=_e(f.time_hour), mi=_e(time_min_formatted), w=_e(f.date_weekday),
+        )
         
         # 対象者名を処理（複数の場合は「、」で区切る）
-        subject_name = str(data.get("subject_name", ""))
+        subject_name = str(f.subject_name)
         if isinstance(subject_name, list):
             # リストの場合は「、」で結合
             subject_name = "、".join(subject_name) if subject_name else ""
         elif isinstance(subject_name, str):
-            # 文字列の場合、改行やカンマが含まれている場合は「、」に統一
-            # 改行を「、」に置換
-            subject_name = subject_name.replace("\n", "、")
-            # カンマも「、」に置換（英語のカンマを日本語の読点に統一）
-            subject_name = subject_name.replace(",", "、")
-            # 連続する「、」を1つに統一
-            while "、、" in subject_name:
-                subject_name = subject_name.replace("、、", "、")
+            # 文字列の場合、改行・カンマ・連続する「、」を1つの「、」に統一
+            subject_name = _SUBJECT_SEP_RE.sub("、", subject_name)
             # 前後の空白と「、」を削除
             subject_name = subject_name.strip("、").strip()
-        # 対象者名が長い場合や複数の場合に備えて、フォントサイズを少し小さく
-        subject_text = f'<para leading="12"><b>対象者</b><br/><font size="10">{subject_name}</font></para>'
+        subject_text = self._TEMPLATES["subject_name"].format(_e(subject_name))
         
         info_row2_data = [
             [
                 Paragraph(datetime_text, self.para_style),
                 Paragraph(
-                    f'<para leading="13.86"><b>発生場所</b><br/>{data.get("location", "")}</para>',
+                    self._TEMPLATES["location"].format(_e(f.location)),
                     self.para_style
                 ),
                 Paragraph(
@@ -505,304 +1041,134 @@ class AccidentReportGenerator:
             rowHeights=[None]
         )
         
-        info_row2_style = TableStyle([
-            ('GRID', (0, 0), (-1, -1), 1.0, colors.black),  # 内側は1px
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            # 外枠を太く（左、右、下）
-            ('LINEBEFORE', (0, 0), (0, 0), 2.0, colors.black),
-            ('LINEAFTER', (-1, 0), (-1, 0), 2.0, colors.black),
-            ('LINEBELOW', (0, 0), (-1, 0), 2.0, colors.black),
-        ])
-        
-        info_row2_table.setStyle(info_row2_style)
+        info_row2_table.setStyle(self._info_row2_style)
         info_row2_w, info_row2_h = info_row2_table.wrapOn(c, content_width, content_height)
         info_row2_table.drawOn(c, start_x, current_y - info_row2_h)
         # マージンを調整（A4に収まるように）
-        current_y -= info_row2_h + 2 * mm
+        current_y -= info_row2_h + _SECTION_GAP
         
         # ===== 本文テーブル =====
         # 横書きカテゴリと横書き内容
         # situationとprocessを統合
-        situation_text = data.get("situation", "")
-        process_text = data.get("process", "")
-        if process_text and process_text != situation_text:
-            situation_full = f"{situation_text}\n\n【経過】\n{process_text}"
+        if f.process and f.process != f.situation:
+            situation_full = f"{f.situation}\n\n【経過】\n{f.process}"
         else:
-            situation_full = situation_text
-        
-        # 横書きカテゴリのテキスト
-        horizontal_labels = [
-            "事故発生状況と経過",
-            "事故原因",
-            "対　策",
-            "その他"
-        ]
+            situation_full = f.situation
         
-        # 本文テーブルの列幅（ラベルカラム: 適切な幅、内容カラム: 残り）
-        # A4に収まるように調整
-        label_col_width = 35 * mm  # 横書きラベル用の幅
-        body_col_width = content_width - label_col_width - 1.0 * 2  # 内容（境界線分を引く）
+        # 本文テーブルの列幅（クラス定数を参照）
+        label_col_width = _LABEL_COL_WIDTH
+        body_col_width = self._BODY_COL_WIDTHS[1]
         
         # 事故原因セクションの準備（原因チェックリストと分類を含む）
-        cause_text = data.get("cause", "")
-        selected_cause_indices = data.get("cause_indices", [])
-        category_index = data.get("category_index", -1)
-        category_text = data.get("category", "")
-        
         # 原因テキストと分類を組み合わせ
         cause_content_parts = []
-        if cause_text:
-            cause_content_parts.append(cause_text)
-        if category_text and category_index >= 0:
-            cause_content_parts.append(f"\n\n【分類】\n{category_text}")
+        if f.cause:
+            cause_content_parts.append(f.cause)
+        if f.category and f.category_index >= 0:
+            cause_content_parts.append(f"\n\n【分類】\n{f.category}")
         cause_content = "\n".join(cause_content_parts) if cause_content_parts else ""
         
-        # 原因セクション用のテーブル（左列: 原因テキスト、右列: チェックリスト用の空セル）
+        # 原因セクションは左60%に原因テキスト、右40%にチェックリスト（後で手動描画）
+        # 右側はcause_para_styleの右インデントで空けておく
         cause_text_width = body_col_width * 0.60  # 左60%
-        cause_checklist_width = body_col_width * 0.40  # 右40%
-        
-        # 原因セクションの内部テーブル（左: 原因テキスト、右: 空セル（後で手動描画））
-        cause_inner_table_data = [
-            [Paragraph(cause_content, self.para_style), ""]  # 右列は空、後で手動描画
-        ]
-        cause_inner_table = Table(
-            cause_inner_table_data,
-            colWidths=[cause_text_width, cause_checklist_width],
-            rowHeights=[None]
-        )
-        cause_inner_table_style = TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-            ('TOPPADDING', (0, 0), (-1, -1), 0),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-        ])
-        cause_inner_table.setStyle(cause_inner_table_style)
         
+        # 横書きカテゴリのラベル（データに依存しないため共有の段落を使う）
+        label_paragraphs = self._body_label_paragraphs
         body_table_data = [
             [
-                Paragraph(horizontal_labels[0], self.body_label_style),
-                Paragraph(situation_full, self.para_style)
+                label_paragraphs[0],
+                Paragraph(_e(situation_full), self.para_style)
             ],
             [
-                Paragraph(horizontal_labels[1], self.body_label_style),
-                cause_inner_table
+                label_paragraphs[1],
+                Paragraph(_e(cause_content), self.cause_para_style)
             ],
             [
-                Paragraph(horizontal_labels[2], self.body_label_style),
-                Paragraph(data.get("countermeasure", ""), self.para_style)
+                label_paragraphs[2],
+                Paragraph(_e(f.countermeasure), self.para_style)
             ],
             [
-                Paragraph(horizontal_labels[3], self.body_label_style),
-                Paragraph(data.get("others", ""), self.para_style)
+                label_paragraphs[3],
+                Paragraph(_e(f.others), self.para_style)
             ]
         ]
         
-        body_col_widths = [
-            label_col_width,  # 横書きカテゴリ
-            body_col_width,  # 内容
-        ]
-        
-        # 行の高さをA4に収まるように調整（HTMLの比率を維持しつつ縮小）
-        # 利用可能な高さを計算: A4高さ297mm - マージン30mm - ヘッダー約30mm - 情報テーブル約40mm - フッター約50mm = 約147mm
-        # HTMLの比率: 250:150:150:100 = 5:3:3:2
-        # 合計13単位で約120mmに調整
-        available_height = 120 * mm
-        unit_height = available_height / 13
-        body_row_heights = [
-            unit_height * 5,  # 事故発生状況と経過
-            unit_height * 3,  # 事故原因
-            unit_height * 3,  # 対策
-            unit_height * 2,  # その他
-        ]
-        
         body_table = Table(
             body_table_data,
-            colWidths=body_col_widths,
-            rowHeights=body_row_heights
+            colWidths=self._BODY_COL_WIDTHS,
+            rowHeights=self._BODY_ROW_HEIGHTS
         )
         
-        body_table_style = TableStyle([
-            ('GRID', (0, 0), (-1, -1), 1.0, colors.black),  # 内側は1px
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),  # ラベルカラム中央
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),    # 内容左
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('LEFTPADDING', (1, 0), (1, -1), 6),
-            ('RIGHTPADDING', (1, 0), (1, -1), 6),
-            ('TOPPADDING', (1, 0), (1, -1), 6),
-            ('BOTTOMPADDING', (1, 0), (1, -1), 6),
-            # 外枠を太く（左、右、下）
-            ('LINEBEFORE', (0, 0), (0, -1), 2.0, colors.black),
-            ('LINEAFTER', (-1, 0), (-1, -1), 2.0, colors.black),
-            ('LINEBELOW', (0, -1), (-1, -1), 2.0, colors.black),
-        ])
-        
-        body_table.setStyle(body_table_style)
+        body_table.setStyle(self._body_table_style)
+        # 列幅・行の高さが固定のため段落の折り返し計算は行われず、wrapOnは軽量
+        # （drawOnに必要な列・行の位置はここで計算されるため省略はできない）
         body_w, body_h = body_table.wrapOn(c, content_width, content_height)
         body_table_y = current_y - body_h
         body_table.drawOn(c, start_x, body_table_y)
         
-        # 原因セクションの右側にチェックリストを手動描画
-        if selected_cause_indices:
-            # 原因セクションの行の位置を計算（2行目）
-            cause_row_y_top = body_table_y + body_h - body_row_heights[0] - body_row_heights[1]
-            cause_row_y_bottom = body_table_y + body_h - body_row_heights[0]
+        # 原因セクションの右側にチェックリストを描画
+        if f.cause_indices:
+            # 原因セクションの行の位置を計算（2行目の上端）
+            cause_row_y_bottom = body_table_y + body_h - self._BODY_ROW_HEIGHTS[0]
             
             # チェックリストの描画位置を計算
             checklist_cell_x = start_x + label_col_width + cause_text_width + 6  # パディング6pt
-            checklist_cell_y = cause_row_y_bottom - 6  # パディング6pt
-            
-            # フォントサイズと行間
-            font_size_pt = 11
-            line_spacing = 2 * mm
-            circle_radius = 2 * mm
-            
-            # フォントの高さ
-            c.setFont(self.font_reg, font_size_pt)
-            font_height = font_size_pt * 1.4
-            
-            # 「該当する事項に○をつける」の説明文を描画
-            instruction_text = "該当する事項に○をつける"
-            c.setFont(self.font_reg, 10)
-            instruction_y = checklist_cell_y - 3 * mm
-            c.drawString(checklist_cell_x, instruction_y, instruction_text)
-            
-            # チェックリストの配置範囲を計算
-            # 説明文の下からセルの最下部まで
-            checklist_top = instruction_y - font_height - line_spacing - 3 * mm  # 説明文の下に少し余裕
-            checklist_bottom = cause_row_y_bottom + 6  # パディング考慮（下から6pt）
             
-            # 12項目を均等に配置するための計算
-            num_items = 12
-            # 上下のパディング（少し余裕を持たせる）
-            vertical_padding = 3 * mm
-            
-            # 選択肢1のY位置（最上部から少し下げる）
-            first_item_y = checklist_top - vertical_padding
-            # 選択肢12のY位置（最下部から少し上げる）
-            last_item_y = checklist_bottom + vertical_padding
-            
-            # 選択肢1と12の間の距離
-            total_spacing = first_item_y - last_item_y
-            # 11個の間隔で均等に分割（選択肢1と12の間には11個の間隔がある）
-            item_spacing = total_spacing / 11
-            
-            # 各チェックリスト項目を描画
-            c.setFont(self.font_reg, font_size_pt)
-            for i in range(1, 13):
-                # 各項目のY位置を計算（選択肢1を最上部、選択肢12を最下部に均等配置）
-                item_y = first_item_y - (i - 1) * item_spacing
-                
-                # 番号を描画（右寄せ、幅25px）
-                num_text = str(i)
-                num_width = c.stringWidth(num_text, self.font_reg, font_size_pt)
-                num_x = checklist_cell_x + self.px_to_mm(25) - num_width
-                c.drawString(num_x, item_y, num_text)
-                
-                # 円を描画（番号の後、margin-right: 5px）
-                circle_x = checklist_cell_x + self.px_to_mm(25) + self.px_to_mm(5) + circle_radius
-                circle_y = item_y + font_height * 0.5
-                
-                if i in selected_cause_indices:
-                    # 選択されている場合は塗りつぶし
-                    c.setFillColor(colors.black)
-                    c.circle(circle_x, circle_y, circle_radius, fill=1)
-                else:
-                    # 選択されていない場合は輪郭のみ
-                    c.setStrokeColor(colors.HexColor('#333333'))
-                    c.setLineWidth(1)
-                    c.circle(circle_x, circle_y, circle_radius, fill=0)
-                
-                # テキストを描画（円の後、margin-right: 5px）
-                text_x = circle_x + circle_radius + self.px_to_mm(5)
-                c.setFillColor(colors.black)
-                c.drawString(text_x, item_y, self.cause_items[i])
-        
-        current_y -= body_h + 3 * mm
+            # 説明文・番号・項目名・輪郭の円（定型部分）はフォームで描画し、
+            # 選択された項目の円だけを塗りつぶして重ねる
+            self._build_checklist_form(c)
+            c.saveState()
+            c.translate(checklist_cell_x, cause_row_y_bottom)
+            c.doForm(self._CHECKLIST_FORM_NAME)
+            c.setStrokeColor(colors.HexColor('#333333'))
+            c.setLineWidth(1)
+            c.setFillColor(colors.black)
+            # JSONやDBから読み込んだデータでは番号が文字列の場合があるため整数に変換する（変換できない値は無視）
+            selected = set()
+            for value in f.cause_indices:
+                try:
+                    selected.add(int(value))
+                except (TypeError, ValueError):
+                    continue
+            for i in sorted(selected):
+                if 1 <= i <= len(_CAUSE_ITEMS):
+                    c.circle(
+                        self._CHECKLIST_CIRCLE_X, self._CHECKLIST_CIRCLE_YS[i - 1],
+                        _CHECKLIST_CIRCLE_RADIUS, fill=1,
+                    )
+            c.restoreState()
+        
+        current_y -= body_h + _BODY_GAP
         
         # ===== フッター =====
         # 説明文と確認文（A4に収まるようにマージンを調整）
-        footer_y = current_y - 8 * mm
-        
-        # 説明文（10pt）
-        c.setFont(self.font_reg, 10)
-        c.drawString(start_x, footer_y, "（説明が必要な場合に署名・捺印を頂きます）")
-        
-        footer_y -= 8 * mm
-        
-        # 確認文（14pt、左マージン20px = 約5.3mm）
-        c.setFont(self.font_reg, 14)
-        c.drawString(start_x + 5.3 * mm, footer_y, "上記について、説明を受けました。")
-        
-        footer_y -= 15 * mm
-        
-        # 署名欄（HTMLでは右寄せ、margin-right: 20px）
-        sign_area_y = footer_y
-        c.setFont(self.font_reg, 11)
-        right_margin = 5.3 * mm
-        sign_area_right = start_x + content_width - right_margin
-        
-        # 日付欄（右寄せ、空欄で「年　　月　　日」のみ表示）
-        space_width = c.stringWidth(" ", self.font_reg, 11)
-        nen_width = c.stringWidth("年", self.font_reg, 11)
-        gatsu_width = c.stringWidth("月", self.font_reg, 11)
-        nichi_width = c.stringWidth("日", self.font_reg, 11)
-        
-        # 空欄の幅を設定（適切な間隔）
-        blank_width = 15 * mm  # 空欄の幅
-        
-        # 全体の幅を計算（空欄 + 年 + 空欄 + 月 + 空欄 + 日）
-        total_date_width = blank_width + nen_width + blank_width + gatsu_width + blank_width + nichi_width
-        
-        # 右寄せで描画
-        date_start_x = sign_area_right - total_date_width
-        x_pos = date_start_x
-        # 空欄（年）
-        x_pos += blank_width
-        c.drawString(x_pos, sign_area_y, "年")
-        x_pos += nen_width + blank_width
-        # 空欄（月）
-        c.drawString(x_pos, sign_area_y, "月")
-        x_pos += gatsu_width + blank_width
-        # 空欄（日）
-        c.drawString(x_pos, sign_area_y, "日")
-        
-        # 改行後の氏名欄（右寄せ、line-height: 2.5相当）
-        sign_area_y -= 20 * mm
-        
-        # 氏名ラベル
-        name_label = "氏名"
-        name_label_width = c.stringWidth(name_label, self.font_reg, 11)
-        # 下線幅200px = 約53mm、印鑑マーク幅、マージンを考慮
-        underline_width = 53 * mm
-        stamp_width = c.stringWidth("印", self.font_reg, 11)
-        total_name_width = name_label_width + 10 * mm + underline_width + 5 * mm + stamp_width
-        
-        name_label_x = sign_area_right - total_name_width
-        c.drawString(name_label_x, sign_area_y, name_label)
-        
-        # 氏名の下線（200px = 約53mm）
-        underline_x = name_label_x + name_label_width + 10 * mm
-        c.setLineWidth(0.5)
-        c.line(underline_x, sign_area_y - 2, underline_x + underline_width, sign_area_y - 2)
-        
-        # 印鑑マーク「印」（下線の右側、margin-left: 5px = 約1.3mm）
-        stamp_x = underline_x + underline_width + 5 * mm
-        c.drawString(stamp_x, sign_area_y, "印")
+        # 署名欄はデータに依存しないため、フォームXObjectとして描画する
+        footer_y = current_y - _FOOTER_LINE_GAP
+        self._build_footer_form(c, content_width)
+        c.saveState()
+        c.translate(start_x, footer_y)
+        c.doForm(self._FOOTER_FORM_NAME)
+        c.restoreState()
         
         # 保存
         c.save()
-        return self.filename
+        return target
+    
+    @classmethod
+    def generate_batch(cls, jobs: List[Tuple[str, Dict[str, Any]]], workers: Optional[int] = None) -> List[str]:
+        """
+        複数の事故報告書PDFを並列に生成
+        
+        Args:
+            jobs: (ファイル名, データ辞書) のタプルのリスト
+            workers: ワーカープロセス数（省略時はCPUコア数）
+            
+        Returns:
+            list: 生成したPDFファイル名のリスト（jobsと同じ順序）
+        """
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            futures = [executor.submit(_render_one, filename, data) for filename, data in jobs]
+            return [future.result() for future in futures]
     
     @staticmethod
     def format_date_for_report(date_obj):
@@ -817,19 +1183,37 @@ class AccidentReportGenerator:
         """
         if isinstance(date_obj, str):
             try:
-                date_obj = datetime.strptime(date_obj, "%Y-%m-%d").date()
-            except:
+                # "YYYY-MM-DD"形式を直接分解（strptimeより高速）
+                y, m, d = date_obj.split("-")
+                date_obj = date(int(y), int(m), int(d))
+            except (ValueError, TypeError):
                 date_obj = datetime.now().date()
         
-        weekdays = ["月", "火", "水", "木", "金", "土", "日"]
-        weekday = weekdays[date_obj.weekday()]
+        year = str(date_obj.year)
+        month = str(date_obj.month)
+        day = str(date_obj.day)
         
         return {
-            "date_year": str(date_obj.year),
-            "date_month": str(date_obj.month),
-            "date_day": str(date_obj.day),
-            "date_weekday": weekday,
-            "record_date_year": str(date_obj.year),
-            "record_date_month": str(date_obj.month),
-            "record_date_day": str(date_obj.day),
+            "date_year": year,
+            "date_month": month,
+            "date_day": day,
+            "date_weekday": _WEEKDAYS[date_obj.weekday()],
+            "record_date_year": year,
+            "record_date_month": month,
+            "record_date_day": day,
         }
+
+
+def _render_one(filename: str, data: Dict[str, Any]) -> str:
+    """
+    1件の事故報告書PDFを生成（generate_batchのワーカープロセスから呼ばれる）
+    
+    Args:
+        filename: 生成するPDFファイル名
+        data: 事故報告の内容を含む辞書
+        
+    Returns:
+        str: 生成したPDFファイル名
+    """
+    AccidentReportGenerator(filename).generate(data)
+    return filename
@@ -3,9 +3,25 @@ AI文章生成アシストモジュール
 grok-4-1-fast-reasoningを使用した文章生成機能
 Gemini 3 Flash Previewを使用した音声認識と議事録生成機能
 """
+import asyncio
+import hashlib
+import json
+import logging
 import os
-from typing import Optional, Dict, Tuple, Any
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+import unicodedata
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     import google.generativeai as genai
@@ -13,6 +29,562 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import json5
+    JSON5_AVAILABLE = True
+except ImportError:
+    JSON5_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# AI応答キャッシュの既定値
+AI_CACHE_DIR = os.getenv("AI_CACHE_DIR", ".ai_cache")
+AI_CACHE_TTL = 86400 * 7  # 7日間
+AI_CACHE_MAX_ENTRIES = 2000
+AUDIO_UPLOAD_TTL = 3600 * 2  # 再試行や補助情報の修正に備えてアップロード済みの音声を再利用する期間（期限切れ後に削除）
+AUDIO_CHUNK_SECONDS = 300  # これより長いWAV音声は分割して並行に書き起こす
+AUDIO_CHUNK_OVERLAP = 2  # 分割境界で言葉が途切れないよう前後を重ねる秒数
+AUDIO_INLINE_MAX_BYTES = 5 * 1024 * 1024  # これ以下の音声はアップロードせずリクエストに直接含める
+MEETING_STRUCTURE_MAX_CHARS = 16000  # 議事録の構造化でGeminiに渡すテキストの上限（日本語で約8千トークン）
+
+# 議事録構造化の指示（固定の指示はsystem_instructionとして渡し、会議テキストだけを毎回送る）
+_MEETING_JSON_INSTRUCTIONS = """以下のJSON形式で出力してください：
+{
+    "議題・内容": "会議の主要な話題と議論内容",
+    "決定事項": "決定された具体的な事項",
+    "共有事項": "スタッフへの連絡事項",
+    "その他メモ": "会議のタイムライン"
+}
+注意:
+- 必ず有効なJSON形式で出力
+- 各項目は簡潔にまとめる
+- 日本語で記述
+- JSON以外は何も出力しない
+"""
+_MEETING_ANALYSIS_PROMPT = (
+    "あなたは保育園の朝礼を分析するアシスタントです。以下のテキストから議事録を作成してください。\n"
+    + _MEETING_JSON_INSTRUCTIONS
+)
+# 音声から直接議事録を作成する場合の指示（書き起こしと構造化を1回の呼び出しで行う）
+_MEETING_AUDIO_PROMPT = (
+    "あなたは保育園の朝礼を分析するアシスタントです。この音声は朝礼の録音です。"
+    "話された内容を正確に聞き取り、議事録を作成してください。\n"
+    + _MEETING_JSON_INSTRUCTIONS
+)
+# 音声書き起こしの指示
+_TRANSCRIBE_PROMPT = """この音声は朝礼の議事録です。音声の内容を正確にテキストに変換してください。
+話し手の言葉をそのまま記録し、言いよどみや繰り返しも含めて正確に書き起こしてください。
+不要な編集は行わず、話された内容を忠実に記録してください。"""
+
+# アップロード済みファイルの削除など、応答を待たせない後片付け用
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gemini-cleanup")
+
+# 音声ファイルの拡張子とMIMEタイプの対応
+_AUDIO_MIME_TYPES = MappingProxyType({
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/wav',
+    '.m4a': 'audio/mp4',
+    '.ogg': 'audio/ogg',
+    '.flac': 'audio/flac',
+    '.webm': 'audio/webm'
+})
+
+# 議事録の各項目の既定値（生成結果に含まれない項目を空文字列で補う）
+_DEFAULT_MINUTES = MappingProxyType({
+    "議題・内容": "",
+    "決定事項": "",
+    "共有事項": "",
+    "その他メモ": ""
+})
+
+
+def _file_digest(path: str) -> str:
+    """
+    ファイル内容のSHA256ハッシュを計算（ファイル全体をメモリに読み込まずに少しずつ処理）
+    
+    Args:
+        path: ファイルのパス
+        
+    Returns:
+        SHA256ハッシュ文字列
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _split_wav(path: str, chunk_seconds: int = AUDIO_CHUNK_SECONDS,
+               overlap_seconds: int = AUDIO_CHUNK_OVERLAP) -> List[str]:
+    """
+    長いWAVファイルを前後が少し重なる一時ファイルに分割
+    
+    Args:
+        path: WAVファイルのパス
+        chunk_seconds: 1ファイルあたりの長さ（秒）
+        overlap_seconds: 隣り合うファイルの重なり（秒）
+        
+    Returns:
+        分割した一時ファイルのパスのリスト（分割不要・分割できない場合は空リスト）
+    """
+    try:
+        with wave.open(path, "rb") as src:
+            params = src.getparams()
+            chunk_frames = chunk_seconds * params.framerate
+            if params.nframes <= chunk_frames:
+                return []
+            overlap_frames = overlap_seconds * params.framerate
+            
+            chunk_paths: List[str] = []
+            for start in range(0, params.nframes, chunk_frames):
+                src.setpos(start)
+                frames = src.readframes(chunk_frames + overlap_frames)
+                fd, chunk_path = tempfile.mkstemp(suffix=".wav")
+                with os.fdopen(fd, "wb") as f, wave.open(f, "wb") as dst:
+                    dst.setparams(params)
+                    dst.writeframes(frames)
+                chunk_paths.append(chunk_path)
+            return chunk_paths
+    except (wave.Error, EOFError):
+        # 非対応のWAV（圧縮形式など）はそのまま一括で処理する
+        return []
+
+
+def _merge_transcripts(parts: List[str], min_overlap: int = 4, max_overlap: int = 80) -> str:
+    """
+    分割して書き起こしたテキストを、重なり部分の重複を除いて結合
+    
+    Args:
+        parts: 各分割ファイルの書き起こし
+        min_overlap: 重複とみなす最小文字数（偶然の一致で文字を削らないため）
+        max_overlap: 重複として探す最大文字数
+        
+    Returns:
+        結合したテキスト
+    """
+    merged = ""
+    for part in parts:
+        part = part.strip()
+        # 前のテキストの末尾と次のテキストの先頭で一致する最長部分を削り、そのままつなげる
+        separator = "\n"
+        for size in range(min(len(merged), len(part), max_overlap), min_overlap - 1, -1):
+            if merged.endswith(part[:size]):
+                part = part[size:]
+                separator = ""
+                break
+        merged = f"{merged}{separator}{part}" if merged else part
+    return merged
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """JSONをUTF-8のバイト列に変換（orjsonがあれば高速に処理）"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """JSONを解析（orjsonがあれば高速に処理。失敗時はjson.JSONDecodeErrorのサブクラスを送出）"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_loads_lenient(text: str) -> Any:
+    """
+    AIが出力したJSONを解析（末尾カンマや引用符のないキーなどの崩れはjson5があれば許容する）
+    
+    Args:
+        text: 解析するJSON文字列
+        
+    Returns:
+        解析結果
+    """
+    try:
+        return _json_loads(text)
+    except json.JSONDecodeError:
+        if not JSON5_AVAILABLE:
+            raise
+        # 厳密な解析で失敗した場合のみjson5で再試行し、失敗時は呼び出し側と同じ例外型にそろえる
+        try:
+            return json5.loads(text)
+        except ValueError as json5_error:
+            raise json.JSONDecodeError(str(json5_error), text, 0) from json5_error
+
+
+# JSONの構造に関わる文字（括弧・引用符・エスケープ）だけを拾い、それ以外の文字は読み飛ばす
+_JSON_SCAN_RES = {
+    "{": re.compile(r'[{}"\\]'),
+    "[": re.compile(r'[\[\]"\\]'),
+}
+
+
+def _extract_json(text: str, opening: str = "{") -> str:
+    """
+    AI応答から最初のJSONオブジェクト（または配列）を取り出す
+    
+    前後の説明文やコードフェンスを除くため、最初の開き括弧から対応する閉じ括弧までを
+    文字列リテラル内の括弧を無視しながら1回の走査で探す。
+    
+    Args:
+        text: AI応答のテキスト
+        opening: 開き括弧（オブジェクトは「{」、配列は「[」）
+        
+    Returns:
+        JSON部分の文字列（開き括弧がなければ元のテキスト、閉じていなければ末尾まで）
+    """
+    start = text.find(opening)
+    if start < 0:
+        return text
+    depth = 0
+    in_string = False
+    escaped_until = -1
+    for match in _JSON_SCAN_RES[opening].finditer(text, start):
+        pos = match.start()
+        if pos < escaped_until:
+            continue
+        char = match.group()
+        if char == "\\":
+            escaped_until = pos + 2
+        elif char == '"':
+            in_string = not in_string
+        elif in_string:
+            continue
+        elif char == opening:
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return text[start:pos + 1]
+    return text[start:]
+
+
+# 受信途中のJSONから議事録の各項目（文字列）を取り出す（閉じ引用符がまだ届いていない値も対象）
+_PARTIAL_FIELD_RE = re.compile(r'"(議題・内容|決定事項|共有事項|その他メモ)"\s*:\s*"((?:[^"\\]|\\.)*)')
+
+
+def _partial_meeting_fields(buffer: str) -> Dict[str, str]:
+    """
+    ストリーミング受信途中の議事録JSONから、読み取れた項目だけを取り出す
+    
+    Args:
+        buffer: これまでに受信したテキスト
+        
+    Returns:
+        項目名と（途中までの）内容の辞書
+    """
+    fields = {}
+    for match in _PARTIAL_FIELD_RE.finditer(buffer):
+        value = match.group(2)
+        if value.endswith("\\") and not value.endswith("\\\\"):
+            # エスケープの途中で切れている場合は次の受信まで待つ
+            value = value[:-1]
+        try:
+            fields[match.group(1)] = _json_loads(f'"{value}"')
+        except ValueError:
+            fields[match.group(1)] = value
+    return fields
+
+
+def _cache_key(payload: Dict[str, Any]) -> str:
+    """
+    リクエスト内容（モデル・プロンプト・温度など）からキャッシュキーを生成
+    
+    Args:
+        payload: APIに送信するリクエスト内容
+        
+    Returns:
+        SHA256ハッシュ文字列
+    """
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+# キーワードの区切りとみなす文字（空白・句読点・記号）
+_KEYWORD_SEP_RE = re.compile(r"[\s、。，．,.・/／;；:：!！?？()（）「」『』\-]+")
+
+
+def _normalize_for_cache(text: str, ignore_order: bool = True) -> str:
+    """
+    言い回しの揺れを吸収したキャッシュ照合用の文字列に正規化
+    
+    全角・半角を統一し、区切り文字の違いを無視する。
+    ignore_orderがTrueの場合はキーワードの並び順も無視する。
+    
+    Args:
+        text: キーワードまたは文章
+        ignore_order: キーワードの並び順を無視するか
+        
+    Returns:
+        正規化された文字列
+    """
+    words = [w for w in _KEYWORD_SEP_RE.split(unicodedata.normalize("NFKC", text).lower()) if w]
+    if ignore_order:
+        words = sorted(set(words))
+    return " ".join(words)
+
+
+# Grokに渡すシステムプロンプト（呼び出しごとに組み立てないようモジュールレベルで保持）
+_SYSTEM_REPORT = "あなたは、世界でトップで優秀な、プロの放課後等デイサービス、児童発達支援の児童指導員であり、世界でトップで優秀な認知科学者であり、世界でトップで優秀なプロの療育の専門家であり、世界でトップで優秀なプロの情報分析官です。放課後デイサービス、児童発達支援の最高の支援記録を作成するのが得意で、入力されたキーワードから気づいたことを抽出し、療育的、認知科学的側面から今後の支援策を作成します。"
+_SYSTEM_TITLE = "あなたは、世界でトップで優秀な、プロのタイトル生成の専門家です。議題・内容から重要なキーワードを抽出し、必ず「○○の件」という形式のタイトルを生成します。\n\n最重要ルール（絶対遵守）: タイトルは必ず「の件」で終わる形式で、20文字以内（「の件」を含む）で返してください。「について」「に関して」などの語尾は使わないでください。説明文や補足は一切不要です。タイトルのみを返してください。引用符、括弧、改行は一切使用しないでください。"
+# タイトル生成の例（few-shot）
+_TITLE_EXAMPLES = (
+    {"role": "user", "content": "議題: 利用者送迎について話し合った\nタイトルを生成してください。"},
+    {"role": "assistant", "content": "利用者送迎に関する件"},
+    {"role": "user", "content": "議題: スタッフ会議で今後の方針を決定した\nタイトルを生成してください。"},
+    {"role": "assistant", "content": "スタッフ会議の件"},
+)
+_SYSTEM_TITLE_BATCH = "あなたは、世界でトップで優秀な、プロのタイトル生成の専門家です。議題・内容から必ず「○○の件」という形式のタイトルを生成します。指定されたJSON配列のみを返してください。"
+_SYSTEM_IMPROVE = "あなたは文章の推敲が得意な編集者です。"
+_SYSTEM_ACCIDENT = "あなたは放課後等デイサービスのベテラン職員で、事故報告書の作成が得意です。客観的で正確な記述を心がけます。"
+_SYSTEM_REPORT_CONTENT = "あなたは放課後等デイサービスのベテラン職員で、報告内容の要約が得意です。簡潔で分かりやすい文章を作成します。"
+_SYSTEM_DAILY_COMMENT = "あなたは世界でトップで有能なプロの放課後等デイサービスの児童指導員です。職員が1日を振り返る日報コメントを、語り口調で、専門性と経験に裏打ちされた文章として作成するのが得意です。"
+_SYSTEM_DAILY_COMMENT_CLOSING = " 遠慮せずに、全力を尽くしてください。秀逸にultrahardに取り組んでください。最高を超えるアウトプットを実現してください。"
+_SYSTEM_HIYARI = "あなたは放課後等デイサービスのベテラン職員で、ヒヤリハット報告書の作成が得意です。客観的で正確な記述を心がけます。"
+
+# Grokに渡すユーザープロンプトの固定部分（呼び出しごとに変わる値だけをformatで埋め込む）
+_REPORT_PROMPT_TEMPLATE = """##要件:
+・100字以内で記述する（厳守）
+・利用者の名前:{display_name}
+・文章形式で簡潔に書く
+・キーワードから課題を抽出して、解決策を導く
+・療育的、認知科学的側面を加える
+・常体で書く
+
+キーワード:
+{keywords}
+"""
+# few-shotの例（_TITLE_EXAMPLES）と同じ形式にそろえる
+_TITLE_PROMPT_TEMPLATE = """議題: {text}
+タイトルを生成してください。"""
+_DAILY_COMMENT_PROMPT_TEMPLATE = """#命令書:
+職員が1日を振り返る日報コメントを作成してください。以下の｢要件｣を踏まえ、｢アウトプット例｣の形式で作成してください。
+
+##要件:
+･文字数は200字ていど
+･文章は簡潔に書く
+･語り口調で書く（「〜でした」「〜しました」「〜できました」など、自然な語り口調）
+･専門性と経験に裏打ちされた文章にする
+･【必須】活動内容: {activity}
+･課題: {challenges}
+･改善点: {improvements}
+
+【重要】入力された活動内容を必ず忠実に反映させてください。活動内容を無視したり、変更したり、追加したりしないでください。
+
+##アウトプット例:
+
+【本日の活動内容】
+{example_activity}
+
+【本日の課題】
+{example_challenges}
+
+【今後の改善点】
+{example_improvements}
+"""
+
+# タイトル整形用（ensure_title_formatなどで毎回生成しないようモジュールレベルで保持）
+_TITLE_DELIMITERS = ('。', '、', '\n', '.', ',', '：', ':', '・', 'について', 'に関して')
+_TITLE_MARKERS = ('例:', '注意:', '出力:', 'タイトル:', '件名:', '件:', '：', ':', '出力例', '例文')
+_TITLE_STRIP_RE = re.compile(r"[\"'「」【】（）()]")
+_WHITESPACE_RE = re.compile(r"\s+")
+# 整形が必要な文字（削除対象の記号・空白・説明文の目印）を含むか判定する
+_TITLE_NEEDS_CLEANUP_RE = re.compile(
+    r"[\"'「」【】（）()\s]|" + "|".join(re.escape(marker) for marker in _TITLE_MARKERS)
+)
+
+
+# 文頭の名詞句（漢字・カタカナ・英数字の連続）の直後に主題を示す語が続く場合のみ一致
+# （「が」「は」「を」が続く語は行為者や対象であることが多く、主題とはみなさない）
+_TOPIC_RE = re.compile(r"^([\u30A0-\u30FF\u4E00-\u9FFF々〆A-Za-z0-9Ａ-Ｚａ-ｚ０-９]{2,18})(?:について|に関して|に関する|の件)")
+
+# 文頭に来ても主題にならない語（日時など）
+_NON_TOPIC_WORDS = frozenset((
+    '今日', '本日', '明日', '昨日', '今週', '来週', '先週', '今月', '来月', '先月',
+    '今回', '次回', '前回', '今後', '午前', '午後', '全員', '皆様', '皆さん'
+))
+
+
+def _extract_topic(text: str) -> str:
+    """
+    テキストの冒頭から主題となる名詞句を抽出（例:「利用者送迎について話し合った」→「利用者送迎」）
+    
+    Args:
+        text: 元となるテキスト
+        
+    Returns:
+        抽出した名詞句（判断できない場合は空文字）
+    """
+    match = _TOPIC_RE.match(text.strip())
+    if not match or match.group(1) in _NON_TOPIC_WORDS:
+        return ""
+    return match.group(1)
+
+
+def _cut_at_delimiter(text: str) -> str:
+    """
+    区切り文字（_TITLE_DELIMITERSの先頭から順に探して最初に見つかったもの）の手前までを返す
+    
+    Args:
+        text: 対象の文字列
+        
+    Returns:
+        区切り文字より前の部分（区切り文字がなければそのまま）
+    """
+    for delimiter in _TITLE_DELIMITERS:
+        if delimiter in text:
+            return text.split(delimiter)[0]
+    return text
+
+
+def _is_grapheme_extender(char: str) -> bool:
+    """直前の文字と結合して1文字として表示される文字（結合文字・異体字セレクタ・絵文字の修飾など）か判定"""
+    code = ord(char)
+    return (
+        unicodedata.category(char) in ("Mn", "Me", "Mc")
+        or 0xFE00 <= code <= 0xFE0F  # 異体字セレクタ
+        or 0xE0100 <= code <= 0xE01EF  # 漢字の異体字セレクタ（IVS）
+        or 0x1F3FB <= code <= 0x1F3FF  # 肌の色の修飾
+        or code == 0x200D  # ゼロ幅接合子
+    )
+
+
+def _truncate_text(text: str, max_length: int) -> str:
+    """
+    文字列を最大文字数で切り詰める（結合文字や異体字セレクタの途中では切らない）
+    
+    Args:
+        text: 対象の文字列
+        max_length: 最大文字数（コードポイント数）
+        
+    Returns:
+        切り詰めた文字列
+    """
+    if len(text) <= max_length:
+        return text
+    cut = max_length
+    # 切り位置の直後が前の文字に結合する文字、または直前がゼロ幅接合子なら、その文字のまとまりごと落とす
+    while cut > 0 and (_is_grapheme_extender(text[cut]) or text[cut - 1] == "\u200d"):
+        cut -= 1
+    # 国旗（地域指示子2文字で1つ）を半分で切らない
+    regional = 0
+    while cut - regional > 0 and 0x1F1E6 <= ord(text[cut - regional - 1]) <= 0x1F1FF:
+        regional += 1
+    if regional % 2:
+        cut -= 1
+    return text[:cut]
+
+
+class ResponseCache:
+    """AI応答を保存する永続キャッシュ（SQLite、有効期限・件数上限付きLRU）"""
+    
+    def __init__(self, path: str, ttl: int = AI_CACHE_TTL, max_entries: int = AI_CACHE_MAX_ENTRIES,
+                 on_evict: Optional[Callable[[str, str], None]] = None):
+        """
+        初期化
+        
+        Args:
+            path: キャッシュファイルのパス
+            ttl: 有効期限（秒）
+            max_entries: 保持する最大件数（超過分は最終参照が古いものから削除）
+            on_evict: 期限切れ・上限超過で削除したエントリ（キー, 値）を受け取るコールバック
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._on_evict = on_evict
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # 複数プロセス（Streamlitのセッションごとの接続）から読み書きしてもロック待ちしにくいようWALを使う
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+    
+    def get(self, key: str) -> Optional[str]:
+        """有効期限内のキャッシュを取得（なければNone）"""
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                    (key, now)
+                ).fetchone()
+                if row is None:
+                    return None
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+                return row[0]
+        except sqlite3.Error:
+            return None
+    
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """キャッシュを保存し、期限切れ・上限超過分を削除（ttl省略時は既定の有効期限）"""
+        now = time.time()
+        if ttl is None:
+            ttl = self.ttl
+        evicted: List[Tuple[str, str]] = []
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, value, now + ttl, now)
+                )
+                evicted += self._evict("expires_at <= ?", (now,))
+                evicted += self._evict(
+                    "key NOT IN (SELECT key FROM responses ORDER BY accessed_at DESC LIMIT ?)",
+                    (self.max_entries,)
+                )
+        except sqlite3.Error:
+            return
+        
+        if self._on_evict is not None:
+            for evicted_key, evicted_value in evicted:
+                self._on_evict(evicted_key, evicted_value)
+    
+    def pop(self, key: str) -> Optional[str]:
+        """キャッシュを削除し、削除した値を返す（なければNone）"""
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT value FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return row[0] if row is not None else None
+        except sqlite3.Error:
+            return None
+    
+    def _evict(self, condition: str, params: Tuple[Any, ...]) -> List[Tuple[str, str]]:
+        """
+        条件に一致するエントリを削除（ロック取得済みのトランザクション内で呼び出す）
+        
+        Args:
+            condition: 削除対象を選ぶWHERE句
+            params: WHERE句のパラメータ
+            
+        Returns:
+            削除した(キー, 値)のリスト（on_evict未指定時は空）
+        """
+        rows = []
+        if self._on_evict is not None:
+            rows = self._conn.execute(
+                f"SELECT key, value FROM responses WHERE {condition}", params
+            ).fetchall()
+        self._conn.execute(f"DELETE FROM responses WHERE {condition}", params)
+        return rows
+
 
 class AIHelper:
     """AI文章生成ヘルパークラス"""
@@ -29,15 +601,148 @@ class AIHelper:
         self.api_url = "https://api.x.ai/v1/chat/completions"
         self.model = "grok-4-1-fast-reasoning"
         
+        # Grok APIへの接続を使い回す（TLSハンドシェイクを毎回行わない）
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=2,  # 最初の送信を含めて最大3回
+                read=False,  # 送信後の読み取りエラーは再送せずそのまま送出する（サーバー側で処理済みの場合の二重課金を防ぐ）
+                other=0,
+                backoff_factor=0.25,  # 2回目の再試行は0.5秒＋ゆらぎ（Retry-Afterがあればそちらを優先）
+                backoff_max=4,
+                backoff_jitter=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["POST"]),
+                raise_on_status=False
+            )
+        ))
+        
         # Gemini API設定
         self.gemini_api_key = gemini_api_key or os.getenv("GEMINI_API_KEY")
+        # genai.configure()はクライアントを作り直すため、設定済みのAPIキーを覚えておき変更時のみ呼び出す
+        self._configured_key: Optional[str] = None
         if GEMINI_AVAILABLE and self.gemini_api_key:
             genai.configure(api_key=self.gemini_api_key)
+            self._configured_key = self.gemini_api_key
+        # GenerativeModelは指示（system_instruction）ごとに使い回す（APIキー変更時に作り直す）
+        self._gemini_models: Dict[str, Any] = {}
+        
+        # 同一入力の再生成ではAPIを呼ばずにキャッシュから返す
+        try:
+            self._cache: Optional[ResponseCache] = ResponseCache(
+                os.path.join(AI_CACHE_DIR, "responses.sqlite3"),
+                on_evict=self._on_cache_evict
+            )
+        except (OSError, sqlite3.Error):
+            # 書き込めない環境ではキャッシュなしで動作
+            self._cache = None
     
     def is_available(self) -> bool:
         """APIキーが設定されているかチェック"""
         return self.api_key is not None and self.api_key.strip() != ""
     
+    def _chat_payload(self, system: str, prompt: str, temperature: float, max_tokens: int,
+                      examples: Sequence[Dict[str, str]] = (), **options: Any) -> Dict[str, Any]:
+        """
+        Grok APIに送信するリクエスト内容を組み立てる
+        
+        Args:
+            system: システムプロンプト
+            prompt: ユーザープロンプト
+            temperature: 生成の温度
+            max_tokens: 最大出力トークン数
+            examples: システムプロンプトとユーザープロンプトの間に入れる例（few-shot）
+            **options: その他のパラメータ（推論モデルのためstopやpenalty系は指定しない）
+            
+        Returns:
+            リクエスト内容
+        """
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system},
+                *examples,
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            **options
+        }
+    
+    def _cached_chat(self, payload: Dict[str, Any], cache_input: Optional[str] = None,
+                     max_chars: Optional[int] = None) -> Tuple[int, str]:
+        """
+        Grok APIを呼び出す（同一リクエストはキャッシュから返す）
+        
+        Args:
+            payload: APIに送信するリクエスト内容
+            cache_input: 照合用に正規化した入力（指定時は最後のユーザーメッセージの代わりに
+                キャッシュキーに使い、語順や句読点だけが違う入力も同じ結果を返す）
+            max_chars: 必要な文字数（指定時はストリーミングで受信し、この文字数に達したら打ち切る）
+            
+        Returns:
+            (HTTPステータスコード, 生成された文章 または エラーレスポンス本文)
+        """
+        if max_chars is not None:
+            payload = dict(payload, stream=True)
+        if cache_input is None:
+            key = _cache_key(payload)
+        else:
+            key = _cache_key(dict(payload, messages=payload["messages"][:-1], input=cache_input))
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return 200, cached
+        
+        response = self._session.post(
+            self.api_url,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            data=_json_dumps(payload),
+            timeout=30,
+            stream=max_chars is not None
+        )
+        if response.status_code != 200:
+            return response.status_code, response.text
+        
+        if max_chars is None:
+            content = _json_loads(response.content)["choices"][0]["message"]["content"]
+        else:
+            content = self._read_stream(response, max_chars)
+        if self._cache is not None:
+            self._cache.set(key, content)
+        return 200, content
+    
+    @staticmethod
+    def _read_stream(response: requests.Response, max_chars: int) -> str:
+        """
+        ストリーミング応答（SSE）から文章を組み立てる
+        
+        Args:
+            response: stream=Trueで取得したレスポンス
+            max_chars: 必要な文字数（先頭の空白を除いてこの文字数に達したら接続を閉じる）
+            
+        Returns:
+            受信した文章
+        """
+        text = ""
+        with response:
+            for line in response.iter_lines():
+                # SSEはcharset指定がないことが多いため、復号せずバイト列のままJSONとして解析する
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    break
+                delta = _json_loads(data)["choices"][0].get("delta", {}).get("content")
+                if delta:
+                    text += delta
+                    if len(text.lstrip()) >= max_chars:
+                        break
+        return text
+    
     def generate_report_text(self, keywords: str, child_name: Optional[str] = None) -> tuple:
         """
         キーワードから日報形式の文章を生成
@@ -59,60 +764,26 @@ class AIHelper:
         display_name = f"{child_name}さん" if child_name else "〇〇さん"
         
         # プロンプトの構築
-        prompt = f"""#命令書 : 
-あなたは、世界でトップで優秀な、プロの放課後等デイサービス、児童発達支援の児童指導員であり、世界でトップで優秀な認知科学者であり、世界でトップで優秀なプロの療育の専門家であり、世界でトップで優秀なプロの情報分析官です。放課後デイサービス、児童発達支援の最高の支援記録を作成してください。以下の要件に基づいて、入力したキーワードから気づいたことを抽出し、療育的、認知科学的側面からそれに関する今後の支援策を作成する。遠慮せずに、全力を尽くしてください。秀逸にultrahardに取り組んでください。
-
-##要件:
-・文字数は 300字程度 
-・利用者の名前:{display_name}
-・文章形式で簡潔に書く
-・キーワードから課題を抽出して、解決策を導く
-・療育的、認知科学的側面を加える
-・常体で書く
-
-キーワード:
-{keywords}
-"""
+        prompt = _REPORT_PROMPT_TEMPLATE.format(display_name=display_name, keywords=keywords)
         
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "あなたは、世界でトップで優秀な、プロの放課後等デイサービス、児童発達支援の児童指導員であり、世界でトップで優秀な認知科学者であり、世界でトップで優秀なプロの療育の専門家であり、世界でトップで優秀なプロの情報分析官です。放課後デイサービス、児童発達支援の最高の支援記録を作成するのが得意です。"
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.7,
-                "max_tokens": 500
-            }
+            payload = self._chat_payload(
+                _SYSTEM_REPORT,
+                prompt,
+                temperature=0.7,
+                max_tokens=160  # 100字に切り詰めるため（1字≒1.5トークン＋余裕）
+            )
             
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=30
+            status_code, content = self._cached_chat(
+                payload, cache_input=f"{display_name}\n{_normalize_for_cache(keywords)}", max_chars=100
             )
             
-            if response.status_code == 200:
-                result = response.json()
-                generated_text = result["choices"][0]["message"]["content"]
+            if status_code == 200:
                 # 100字以内に制限
-                generated_text = generated_text.strip()
-                if len(generated_text) > 100:
-                    generated_text = generated_text[:100]
+                generated_text = _truncate_text(content.strip(), 100)
                 return True, generated_text
             else:
-                error_msg = f"APIエラー: {response.status_code} - {response.text}"
+                error_msg = f"APIエラー: {status_code} - {content}"
                 return False, error_msg
                 
         except requests.exceptions.Timeout:
@@ -122,138 +793,6 @@ class AIHelper:
         except Exception as e:
             return False, f"予期しないエラーが発生しました: {str(e)}"
     
-    def is_gemini_available(self) -> bool:
-        """Gemini APIキーが設定されているかチェック"""
-        return GEMINI_AVAILABLE and self.gemini_api_key is not None and self.gemini_api_key.strip() != ""
-    
-    def _ensure_gemini_configured(self):
-        """Gemini APIキーが正しく設定されているか確認し、必要に応じて設定する"""
-        if not GEMINI_AVAILABLE or not self.gemini_api_key:
-            return False
-        
-        try:
-            # APIキーをクリーンアップ（余分な空白や改行を削除）
-            api_key = self.gemini_api_key.strip()
-            # 複数のAPIキーが結合されている可能性があるため、最初の有効なキーのみを使用
-            if ' ' in api_key:
-                # スペースで区切られている場合、最初の部分のみを使用
-                api_key = api_key.split()[0]
-            
-            # genai.configure()を再呼び出して、最新のAPIキーを設定
-            genai.configure(api_key=api_key)
-            self.gemini_api_key = api_key
-            return True
-        except Exception:
-            return False
-    
-    def transcribe_audio_to_text(self, audio_file_path: str, context_info: Optional[str] = None) -> Tuple[bool, str]:
-        """
-        音声ファイルをテキストに変換（Gemini 3 Flash Preview使用）
-        
-        Args:
-            audio_file_path: 音声ファイルのパス
-            context_info: 補助情報（名前、固有名詞など）を記載したテキスト
-            
-        Returns:
-            (成功フラグ, 変換されたテキストまたはエラーメッセージ)
-        """
-        if not self.is_gemini_available():
-            return False, "Gemini APIキーが設定されていません。設定画面でAPIキーを入力してください。"
-        
-        if not os.path.exists(audio_file_path):
-            return False, "音声ファイルが見つかりません。"
-        
-        # APIキーが正しく設定されているか確認
-        if not self._ensure_gemini_configured():
-            return False, "Gemini APIキーの設定に失敗しました。設定画面でAPIキーを確認してください。"
-        
-        try:
-            # ファイル拡張子からMIMEタイプを判定
-            file_ext = os.path.splitext(audio_file_path)[1].lower()
-            mime_types = {
-                '.mp3': 'audio/mpeg',
-                '.wav': 'audio/wav',
-                '.m4a': 'audio/mp4',
-                '.ogg': 'audio/ogg',
-                '.flac': 'audio/flac',
-                '.webm': 'audio/webm'
-            }
-            mime_type = mime_types.get(file_ext, 'audio/mpeg')
-            
-            # Gemini 3 Flash Previewを使用して音声をテキストに変換
-            model = genai.GenerativeModel('gemini-3-flash-preview')
-            
-            # 音声ファイルをアップロード
-            audio_file_obj = genai.upload_file(
-                path=audio_file_path,
-                mime_type=mime_type
-            )
-            
-            # プロンプトを設定
-            prompt = """この音声は朝礼の議事録です。音声の内容を正確にテキストに変換してください。
-話し手の言葉をそのまま記録し、言いよどみや繰り返しも含めて正確に書き起こしてください。
-不要な編集は行わず、話された内容を忠実に記録してください。"""
-            
-            # 補助情報がある場合はプロンプトに追加
-            if context_info and context_info.strip():
-                prompt += f"""
-
-以下の情報を参考にして、音声内の名前や固有名詞の認識精度を向上させてください：
-{context_info}
-
-これらの情報を参考にしながら、音声の内容を正確にテキストに変換してください。"""
-            
-            # 音声認識を実行
-            response = model.generate_content([prompt, audio_file_obj])
-            
-            # テキストを取得
-            transcribed_text = response.text.strip()
-            
-            # アップロードしたファイルを削除
-            genai.delete_file(audio_file_obj.name)
-            
-            return True, transcribed_text
-            
-        except Exception as e:
-            return False, f"音声認識エラー: {str(e)}"
-    
-    def generate_meeting_minutes_from_audio(self, audio_file_path: str, context_info: Optional[str] = None) -> Tuple[bool, Dict[str, str]]:
-        """
-        音声ファイルから朝礼議事録を生成（Gemini 3 Flash Preview使用）
-        
-        Args:
-            audio_file_path: 音声ファイルのパス
-            context_info: 補助情報（名前、固有名詞など）を記載したテキスト
-            
-        Returns:
-            (成功フラグ, 議事録データの辞書またはエラーメッセージ)
-        """
-        if not self.is_gemini_available():
-            return False, "Gemini APIキーが設定されていません。設定画面でAPIキーを入力してください。"
-        
-        if not os.path.exists(audio_file_path):
-            return False, "音声ファイルが見つかりません。"
-        
-        try:
-            # まず音声をテキストに変換（補助情報を含める）
-            print("[DEBUG] Starting audio transcription")
-            success, transcribed_text = self.transcribe_audio_to_text(audio_file_path, context_info)
-            print(f"[DEBUG] Transcription result: success={success}, text_length={len(transcribed_text) if transcribed_text else 0}")
-            if not success:
-                return False, transcribed_text
-
-            # テキストから議事録を構造化
-            print("[DEBUG] Starting meeting minutes generation")
-            result = self.generate_meeting_minutes_from_text(transcribed_text)
-            print(f"[DEBUG] Final result: {result}")
-            return result
-
-        except Exception as e:
-            print(f"[DEBUG] Exception in generate_meeting_minutes_from_audio: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return False, f"議事録生成エラー: {str(e)}"
-    
     def ensure_title_format(self, title: str, source_text: str = "") -> str:
         """
         タイトルが必ず「の件」形式になることを保証する（最終的な強制処理）
@@ -265,25 +804,24 @@ class AIHelper:
         Returns:
             「の件」形式で終わるタイトル
         """
+        # AIがそのまま使える「○○の件」を返した場合（大半）は整形せずに返す
+        stripped = title.strip() if title else ""
+        if 3 <= len(stripped) <= 20 and stripped.endswith("の件") and not _TITLE_NEEDS_CLEANUP_RE.search(stripped):
+            return stripped
+        
         if not title or not title.strip():
             # タイトルが空の場合は、元のテキストから生成
             if source_text:
-                title = source_text.strip()[:18]
-                for delimiter in ['。', '、', '\n', '.', ',', '：', ':', '・', 'について', 'に関して']:
-                    if delimiter in title:
-                        title = title.split(delimiter)[0]
-                        break
+                title = _cut_at_delimiter(source_text.strip()[:18])
             else:
                 title = "議事録の件"
         
         # 余分な文字を削除
-        title = title.strip()
-        title = title.replace('"', '').replace("'", '').replace('「', '').replace('」', '').replace('【', '').replace('】', '').replace('（', '').replace('）', '').replace('(', '').replace(')', '')
-        title = ' '.join(title.split())
-        title = title.replace('\n', '').replace('\r', '').replace('\t', '')
+        title = _TITLE_STRIP_RE.sub('', title)
+        title = _WHITESPACE_RE.sub(' ', title).strip()
         
         # 説明文や補足を削除
-        for marker in ['例:', '注意:', '出力:', 'タイトル:', '件名:', '件:', '：', ':', '出力例', '例文']:
+        for marker in _TITLE_MARKERS:
             if marker in title:
                 title = title.split(marker)[-1].strip()
         
@@ -316,11 +854,7 @@ class AIHelper:
         # 空文字列や「の件」だけの場合はフォールバック
         if not title or title == "の件" or len(title) < 3:
             if source_text:
-                fallback = source_text.strip()[:18]
-                for delimiter in ['。', '、', '\n', '.', ',', '：', ':', '・', 'について', 'に関して']:
-                    if delimiter in fallback:
-                        fallback = fallback.split(delimiter)[0]
-                        break
+                fallback = _cut_at_delimiter(source_text.strip()[:18])
                 title = fallback + "の件" if fallback else "議事録の件"
             else:
                 title = "議事録の件"
@@ -342,13 +876,8 @@ class AIHelper:
             if not text or not text.strip():
                 return False, ""
             
-            # テキストの最初の18文字程度を取得
-            title = text.strip()[:18]
-            # 句読点や改行で区切る
-            for delimiter in ['。', '、', '\n', '.', ',', '：', ':', '・', 'について', 'に関して']:
-                if delimiter in title:
-                    title = title.split(delimiter)[0]
-                    break
+            # 冒頭の主題、なければ最初の18文字程度を句読点や改行で区切った部分を使う
+            title = _extract_topic(text) or _cut_at_delimiter(text.strip()[:18])
             
             # 強制的に「の件」形式に変換（最終的な保証）
             title = self.ensure_title_format(title, text.strip())
@@ -358,109 +887,33 @@ class AIHelper:
         if not text or not text.strip():
             return False, ""
         
+        # 冒頭の主題が明確な場合はAPIを呼ばずにタイトルにする
+        topic = _extract_topic(text)
+        if topic:
+            return True, self.ensure_title_format(topic + "の件", text.strip())
+        
         # テキストを前処理（最初の100文字程度を取得）
-        text_preview = text.strip()[:100]
-        for delimiter in ['。', '、', '\n', '.', ',', '：', ':', '・', 'について', 'に関して']:
-            if delimiter in text_preview:
-                text_preview = text_preview.split(delimiter)[0]
-                break
+        text_preview = _cut_at_delimiter(text.strip()[:100])
         
-        prompt = f"""#命令書（絶対遵守・違反不可）
-あなたは、世界でトップで優秀な、プロのタイトル生成の専門家です。遠慮せずに、全力を尽くしてください。秀逸にultrahardに取り組んでください。
-
-##最重要ルール（絶対遵守・違反不可）:
-1. 出力は必ず「○○の件」という形式で終わること（「の件」で終わらない場合は無効・絶対禁止）
-2. 「の件」以外の文字列は一切返さないこと（説明文、補足、例、注意書きは一切不要）
-3. タイトルのみを返すこと（引用符、括弧、改行、空白行は一切不要）
-4. 20文字以内（「の件」を含む）にまとめること
-
-##入力議題・内容:
-{text}
-
-##正しい出力例（この形式のみ有効・必ずこの形式で返すこと）:
-利用者送迎に関する件
-スタッフ会議の件
-設備点検の件
-安全確認の件
-利用者対応の件
-送迎業務の件
-
-##間違った出力例（絶対に返さないこと）:
-利用者送迎について
-スタッフ会議
-設備点検に関する報告
-安全確認についての件名
-「利用者送迎の件」
-【スタッフ会議の件】
-
-##禁止事項（絶対に守ること・違反不可）:
-- 「の件」で終わらないタイトルは返さない（絶対禁止）
-- 説明文や補足を付けない（絶対禁止）
-- 引用符や括弧で囲まない（絶対禁止）
-- 改行を入れない（絶対禁止）
-- 「について」「に関して」などの語尾は使わない（「の件」のみ使用）
-
-##出力指示:
-上記の正しい出力例の形式で、タイトルのみを「○○の件」形式で返してください。
-議題・内容から重要なキーワードを抽出し、「○○の件」という形式で返してください。"""
+        # タイトルは冒頭から決まるため、長い議事録でも先頭部分だけを送る（一括生成と同じ長さ）
+        prompt = _TITLE_PROMPT_TEMPLATE.format(text=text.strip()[:100])
         
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "あなたは、世界でトップで優秀な、プロのタイトル生成の専門家です。議題・内容から必ず「○○の件」という形式のタイトルを生成します。遠慮せずに、全力を尽くしてください。秀逸にultrahardに取り組んでください。\n\n最重要ルール（絶対遵守）: タイトルは必ず「の件」で終わる形式で返してください。「の件」で終わらないタイトルは絶対に返さないでください。説明文や補足は一切不要です。タイトルのみを返してください。引用符、括弧、改行は一切使用しないでください。"
-                    },
-                    {
-                        "role": "user",
-                        "content": "議題: 利用者送迎について話し合った\nタイトルを生成してください。"
-                    },
-                    {
-                        "role": "assistant",
-                        "content": "利用者送迎に関する件"
-                    },
-                    {
-                        "role": "user",
-                        "content": "議題: スタッフ会議で今後の方針を決定した\nタイトルを生成してください。"
-                    },
-                    {
-                        "role": "assistant",
-                        "content": "スタッフ会議の件"
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.05,
-                "max_tokens": 25
-            }
-            
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=30
+            payload = self._chat_payload(
+                _SYSTEM_TITLE,
+                prompt,
+                temperature=0.05,
+                max_tokens=25,
+                examples=_TITLE_EXAMPLES
             )
             
-            if response.status_code == 200:
-                result = response.json()
-                raw_title = result["choices"][0]["message"]["content"].strip()
+            status_code, content = self._cached_chat(payload, max_chars=20)
+            
+            if status_code == 200:
+                raw_title = content.strip()
                 
                 # 強制的に「の件」形式に変換（最終的な保証）
-                title = self.ensure_title_format(raw_title, text_preview)
-                
-                # 最終確認: 必ず「の件」で終わることを確認（二重チェック）
-                if not title.endswith("の件"):
-                    title = self.ensure_title_format("", text.strip())
-                
-                return True, title
+                return True, self.ensure_title_format(raw_title, text_preview)
             else:
                 # APIエラーの場合は簡易的にタイトルを生成（必ず「の件」で終わる）
                 title = self.ensure_title_format("", text.strip())
@@ -471,6 +924,72 @@ class AIHelper:
             title = self.ensure_title_format("", text.strip())
             return True, title
     
+    def finalize_title(self, text: str) -> str:
+        """
+        テキストからタイトルを生成し、失敗した場合は簡易的に生成したタイトルを返す
+        
+        Args:
+            text: 元となるテキスト（議題・内容など）
+            
+        Returns:
+            「の件」形式で終わるタイトル
+        """
+        success, title = self.generate_title_from_text(text)
+        return title if success and title else self.ensure_title_format("", text)
+    
+    def generate_titles_from_texts(self, texts: List[str]) -> List[str]:
+        """
+        複数のテキストからタイトル（「○○の件」形式）を1回のAPI呼び出しでまとめて生成
+        
+        Args:
+            texts: 元となるテキスト（議題・内容など）のリスト
+            
+        Returns:
+            各テキストに対応するタイトルのリスト（空のテキストは空文字）
+        """
+        if len(texts) <= 1 or not self.is_available():
+            return [self.generate_title_from_text(text)[1] for text in texts]
+        
+        items = [
+            {"id": i, "text": text.strip()[:100]}
+            for i, text in enumerate(texts) if text and text.strip()
+        ]
+        titles: Dict[int, str] = {}
+        
+        if items:
+            prompt = f"""次の{len(items)}件の議題・内容から、それぞれ「○○の件」形式のタイトル（20文字以内）を生成してください。
+
+##入力（JSON配列）:
+{json.dumps(items, ensure_ascii=False)}
+
+##出力形式（JSON配列のみを返すこと。説明文は一切不要）:
+[{{"id": 0, "title": "○○の件"}}, ...]"""
+            
+            payload = self._chat_payload(
+                _SYSTEM_TITLE_BATCH,
+                prompt,
+                temperature=0.05,
+                max_tokens=30 * len(items)
+            )
+            
+            try:
+                status_code, content = self._cached_chat(payload)
+                if status_code == 200:
+                    for entry in _json_loads_lenient(_extract_json(content, "[")):
+                        if isinstance(entry, dict) and isinstance(entry.get("title"), str):
+                            titles[int(entry["id"])] = entry["title"].strip()
+            except Exception:
+                # 解析できない場合は各テキストから簡易的に生成する
+                titles = {}
+        
+        results = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results.append("")
+                continue
+            results.append(self.ensure_title_format(titles.get(i, ""), text.strip()))
+        return results
+    
     def improve_text(self, text: str) -> tuple:
         """
         既存の文章を改善・推敲
@@ -495,40 +1014,22 @@ class AIHelper:
 改善された文章のみを返してください。"""
         
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "あなたは文章の推敲が得意な編集者です。"
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.5,
-                "max_tokens": 500
-            }
+            payload = self._chat_payload(
+                _SYSTEM_IMPROVE,
+                prompt,
+                temperature=0.5,
+                max_tokens=500
+            )
             
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=30
+            status_code, content = self._cached_chat(
+                payload, cache_input=_normalize_for_cache(text, ignore_order=False)
             )
             
-            if response.status_code == 200:
-                result = response.json()
-                improved_text = result["choices"][0]["message"]["content"]
+            if status_code == 200:
+                improved_text = content
                 return True, improved_text.strip()
             else:
-                error_msg = f"APIエラー: {response.status_code} - {response.text}"
+                error_msg = f"APIエラー: {status_code} - {content}"
                 return False, error_msg
                 
         except Exception as e:
@@ -580,44 +1081,23 @@ class AIHelper:
 {type_name}に関する文章のみを返してください。"""
         
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "あなたは放課後等デイサービスのベテラン職員で、事故報告書の作成が得意です。客観的で正確な記述を心がけます。"
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.7,
-                "max_tokens": 500
-            }
+            payload = self._chat_payload(
+                _SYSTEM_ACCIDENT,
+                prompt,
+                temperature=0.7,
+                max_tokens=160  # 100字に切り詰めるため（1字≒1.5トークン＋余裕）
+            )
             
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=30
+            status_code, content = self._cached_chat(
+                payload, cache_input=f"{type_name}\n{_normalize_for_cache(keywords)}", max_chars=100
             )
             
-            if response.status_code == 200:
-                result = response.json()
-                generated_text = result["choices"][0]["message"]["content"]
+            if status_code == 200:
                 # 100字以内に制限
-                generated_text = generated_text.strip()
-                if len(generated_text) > 100:
-                    generated_text = generated_text[:100]
+                generated_text = _truncate_text(content.strip(), 100)
                 return True, generated_text
             else:
-                error_msg = f"APIエラー: {response.status_code} - {response.text}"
+                error_msg = f"APIエラー: {status_code} - {content}"
                 return False, error_msg
                 
         except requests.exceptions.Timeout:
@@ -657,45 +1137,23 @@ class AIHelper:
 報告内容の要約文のみを返してください。"""
         
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "あなたは放課後等デイサービスのベテラン職員で、報告内容の要約が得意です。簡潔で分かりやすい文章を作成します。"
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.7,
-                "max_tokens": 100
-            }
-            
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=30
+            payload = self._chat_payload(
+                _SYSTEM_REPORT_CONTENT,
+                prompt,
+                temperature=0.7,
+                max_tokens=80  # 50字に切り詰めるため（1字≒1.5トークン＋余裕）
             )
             
-            if response.status_code == 200:
-                result = response.json()
-                generated_text = result["choices"][0]["message"]["content"].strip()
+            status_code, content = self._cached_chat(payload, max_chars=50)
+            
+            if status_code == 200:
                 # 50字以内に制限
-                if len(generated_text) > 50:
-                    generated_text = generated_text[:50]
+                generated_text = _truncate_text(content.strip(), 50)
                 return True, generated_text
             else:
-                error_msg = f"APIエラー: {response.status_code}"
+                error_msg = f"APIエラー: {status_code}"
                 try:
-                    error_detail = response.json()
+                    error_detail = json.loads(content)
                     if "error" in error_detail:
                         error_msg = error_detail["error"].get("message", error_msg)
                 except:
@@ -709,276 +1167,135 @@ class AIHelper:
         except Exception as e:
             return False, f"予期しないエラーが発生しました: {str(e)}"
     
-    def generate_daily_comment(self, activity_content: str = "", challenges: str = "", improvements: str = "") -> tuple:
+    def _run_bulk(self, func: Callable[..., tuple], args_list: Sequence[Tuple[Any, ...]],
+                  max_workers: int) -> List[tuple]:
         """
-        日報コメントを生成（職員が1日を振り返るコメント）
+        同じ生成処理を複数の入力に対して並行に実行
         
         Args:
-            activity_content: 活動内容（学習支援、自由遊びの見守り、集団遊びの補助など）
-            challenges: 課題
-            improvements: 改善点
+            func: 生成処理（(成功フラグ, 文章)を返すメソッド）
+            args_list: 各呼び出しの引数
+            max_workers: 同時に実行する最大数
             
         Returns:
-            (成功フラグ, 生成された日報コメント)
+            入力と同じ順序の(成功フラグ, 文章)のリスト
         """
-        if not self.is_available():
-            return False, "APIキーが設定されていません。設定画面でAPIキーを入力してください。"
-        
-        # プロンプトの構築
-        prompt = f"""#命令書:
-あなたは世界でトップで有能なプロの放課後等デイサービスの児童指導員です。職員が1日を振り返る日報コメントを作成してください。以下の｢要件｣を踏まえ、｢アウトプット例｣のように、最高の日報コメントを作成してください。
-
-##要件:
-･文字数は200字ていど
-･文章は簡潔に書く
-･語り口調で書く（「〜でした」「〜しました」「〜できました」など、自然な語り口調）
-･世界でトップで有能なプロの放課後等デイサービスの職員として、専門性と経験に裏打ちされた文章にする
-･【必須】活動内容: {activity_content if activity_content else "学習支援、自由遊びの見守り、集団遊びの補助"}
-･課題: {challenges if challenges else "特になし"}
-･改善点: {improvements if improvements else "特になし"}
-
-【重要】必ず入力された活動内容を反映させてください。活動内容「{activity_content if activity_content else "なし"}」が入力されている場合は、それを基に日報コメントを作成してください。活動内容を無視したり、変更したりしないでください。
-
-##アウトプット例:
-
-【本日の活動内容】
-{activity_content if activity_content else "本日は学習支援、自由遊びの見守り、集団遊びの補助を行いました。"}
-
-【本日の課題】
-{challenges if challenges else "特に大きな課題はなかったが、より良い支援ができるよう努めたい。"}
-
-【今後の改善点】
-{improvements if improvements else "より効果的な支援方法を検討していきたい。"}
-
-上記の形式で、入力された情報を基に、語り口調で、世界でトップで有能なプロの放課後等デイサービスの職員としてふさわしい、最高の日報コメントを作成してください。
-
-【最重要】活動内容「{activity_content}」を必ず反映させてください。この活動内容を基に日報コメントを作成してください。活動内容を無視したり、変更したり、追加したりしないでください。入力された活動内容を忠実に反映させてください。
-
-遠慮せずに全力を尽くしてください。秀逸にultrahardに取り組んでください。最高を超えるアウトプットを実現してください。"""
-        
-        try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            # システムメッセージをactivity_contentの有無で調整
-            system_content = "あなたは世界でトップで有能なプロの放課後等デイサービスの児童指導員です。職員が1日を振り返る日報コメントを、語り口調で、専門性と経験に裏打ちされた文章として作成するのが得意です。"
-            if activity_content:
-                system_content += f" 必ず以下の活動内容を反映させてください：{activity_content}"
-            system_content += " 遠慮せずに、全力を尽くしてください。秀逸にultrahardに取り組んでください。最高を超えるアウトプットを実現してください。"
-
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": system_content
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.7,
-                "max_tokens": 500
-            }
-            
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                generated_text = result["choices"][0]["message"]["content"].strip()
-                return True, generated_text
-            else:
-                error_msg = f"APIエラー: {response.status_code} - {response.text}"
-                return False, error_msg
-                
-        except requests.exceptions.Timeout:
-            return False, "APIへの接続がタイムアウトしました。しばらく待ってから再試行してください。"
-        except requests.exceptions.RequestException as e:
-            return False, f"API接続エラー: {str(e)}"
-        except Exception as e:
-            return False, f"予期しないエラーが発生しました: {str(e)}"
-
-
-    def is_gemini_available(self) -> bool:
-        """Gemini APIキーが設定されているかチェック"""
-        return GEMINI_AVAILABLE and self.gemini_api_key is not None and self.gemini_api_key.strip() != ""
-    
-    def _ensure_gemini_configured(self):
-        """Gemini APIキーが正しく設定されているか確認し、必要に応じて設定する"""
-        if not GEMINI_AVAILABLE or not self.gemini_api_key:
-            return False
-        
-        try:
-            # APIキーをクリーンアップ（余分な空白や改行を削除）
-            api_key = self.gemini_api_key.strip()
-            # 複数のAPIキーが結合されている可能性があるため、最初の有効なキーのみを使用
-            if ' ' in api_key:
-                # スペースで区切られている場合、最初の部分のみを使用
-                api_key = api_key.split()[0]
-            
-            # genai.configure()を再呼び出して、最新のAPIキーを設定
-            genai.configure(api_key=api_key)
-            self.gemini_api_key = api_key
-            return True
-        except Exception:
-            return False
-    
-    def transcribe_audio_to_text(self, audio_file_path: str, context_info: Optional[str] = None) -> Tuple[bool, str]:
-        """
-        音声ファイルをテキストに変換（Gemini 3 Flash Preview使用）
-        
-        Args:
-            audio_file_path: 音声ファイルのパス
-            context_info: 補助情報（名前、固有名詞など）を記載したテキスト
-            
-        Returns:
-            (成功フラグ, 変換されたテキストまたはエラーメッセージ)
-        """
-        if not self.is_gemini_available():
-            return False, "Gemini APIキーが設定されていません。設定画面でAPIキーを入力してください。"
-        
-        if not os.path.exists(audio_file_path):
-            return False, "音声ファイルが見つかりません。"
-        
-        # APIキーが正しく設定されているか確認
-        if not self._ensure_gemini_configured():
-            return False, "Gemini APIキーの設定に失敗しました。設定画面でAPIキーを確認してください。"
-        
-        try:
-            # ファイル拡張子からMIMEタイプを判定
-            file_ext = os.path.splitext(audio_file_path)[1].lower()
-            mime_types = {
-                '.mp3': 'audio/mpeg',
-                '.wav': 'audio/wav',
-                '.m4a': 'audio/mp4',
-                '.ogg': 'audio/ogg',
-                '.flac': 'audio/flac',
-                '.webm': 'audio/webm'
-            }
-            mime_type = mime_types.get(file_ext, 'audio/mpeg')
-            
-            # Gemini 3 Flash Previewを使用して音声をテキストに変換
-            model = genai.GenerativeModel('gemini-3-flash-preview')
-            
-            # 音声ファイルをアップロード
-            audio_file_obj = genai.upload_file(
-                path=audio_file_path,
-                mime_type=mime_type
-            )
-            
-            # プロンプトを設定
-            prompt = """この音声は朝礼の議事録です。音声の内容を正確にテキストに変換してください。
-話し手の言葉をそのまま記録し、言いよどみや繰り返しも含めて正確に書き起こしてください。
-不要な編集は行わず、話された内容を忠実に記録してください。"""
-            
-            # 補助情報がある場合はプロンプトに追加
-            if context_info and context_info.strip():
-                prompt += f"""
-
-以下の情報を参考にして、音声内の名前や固有名詞の認識精度を向上させてください：
-{context_info}
-
-これらの情報を参考にしながら、音声の内容を正確にテキストに変換してください。"""
-            
-            # 音声認識を実行
-            response = model.generate_content([prompt, audio_file_obj])
-            
-            # テキストを取得
-            transcribed_text = response.text.strip()
-            
-            # アップロードしたファイルを削除
-            genai.delete_file(audio_file_obj.name)
-            
-            return True, transcribed_text
-            
-        except Exception as e:
-            return False, f"音声認識エラー: {str(e)}"
+        return self.generate_many([(func, args) for args in args_list], max_workers)
     
-    def generate_meeting_minutes_from_audio(self, audio_file_path: str, context_info: Optional[str] = None) -> Tuple[bool, Dict[str, str]]:
+    def generate_many(self, calls: Sequence[Tuple[Callable[..., tuple], Tuple[Any, ...]]],
+                      max_workers: int = 8) -> List[tuple]:
         """
-        音声ファイルから朝礼議事録を生成（Gemini 3 Flash Preview使用）
+        種類の異なる生成処理をまとめて並行に実行（タイトル・報告内容・コメントなどを同時に生成する）
         
         Args:
-            audio_file_path: 音声ファイルのパス
-            context_info: 補助情報（名前、固有名詞など）を記載したテキスト
+            calls: (生成処理, 引数)のリスト（例: [(helper.generate_title_from_text, (text,)), ...]）
+            max_workers: 同時に実行する最大数
             
         Returns:
-            (成功フラグ, 議事録データの辞書またはエラーメッセージ)
+            入力と同じ順序の(成功フラグ, 文章)のリスト
         """
-        if not self.is_gemini_available():
-            return False, "Gemini APIキーが設定されていません。設定画面でAPIキーを入力してください。"
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            futures = [executor.submit(func, *args) for func, args in calls]
+            return [future.result() for future in futures]
+    
+    def generate_report_texts_bulk(self, items: Sequence[Tuple[str, Optional[str]]], max_workers: int = 8) -> List[tuple]:
+        """
+        複数の児童の日報文章をまとめて生成（並行にAPIを呼び出す）
         
-        if not os.path.exists(audio_file_path):
-            return False, "音声ファイルが見つかりません。"
+        Args:
+            items: (キーワード, 児童名)のリスト
+            max_workers: 同時に実行する最大数
+            
+        Returns:
+            各入力に対応する(成功フラグ, 生成された文章)のリスト
+        """
+        return self._run_bulk(self.generate_report_text, items, max_workers)
+    
+    def generate_accident_reports_bulk(self, items: Sequence[Tuple[str, str]], max_workers: int = 8) -> List[tuple]:
+        """
+        事故報告書の複数項目の文章をまとめて生成（並行にAPIを呼び出す）
         
-        try:
-            # まず音声をテキストに変換（補助情報を含める）
-            print("[DEBUG] Starting audio transcription")
-            success, transcribed_text = self.transcribe_audio_to_text(audio_file_path, context_info)
-            print(f"[DEBUG] Transcription result: success={success}, text_length={len(transcribed_text) if transcribed_text else 0}")
-            if not success:
-                return False, transcribed_text
-
-            # テキストから議事録を構造化
-            print("[DEBUG] Starting meeting minutes generation")
-            result = self.generate_meeting_minutes_from_text(transcribed_text)
-            print(f"[DEBUG] Final result: {result}")
-            return result
-
-        except Exception as e:
-            print(f"[DEBUG] Exception in generate_meeting_minutes_from_audio: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return False, f"議事録生成エラー: {str(e)}"
+        Args:
+            items: (キーワード, 項目タイプ)のリスト
+            max_workers: 同時に実行する最大数
+            
+        Returns:
+            各入力に対応する(成功フラグ, 生成された文章)のリスト
+        """
+        return self._run_bulk(self.generate_accident_report, items, max_workers)
     
-    def generate_meeting_minutes_from_text(self, text: str) -> Tuple[bool, Dict[str, str]]:
+    def generate_report_contents_bulk(self, keywords_list: Sequence[str], max_workers: int = 8) -> List[tuple]:
         """
-        テキストから朝礼議事録を構造化して生成（Gemini 3 Flash Preview使用）
+        複数の報告内容の要約文をまとめて生成（並行にAPIを呼び出す）
         
         Args:
-            text: 議事録の元となるテキスト
+            keywords_list: キーワードのリスト
+            max_workers: 同時に実行する最大数
             
         Returns:
-            (成功フラグ, 議事録データの辞書またはエラーメッセージ)
+            各入力に対応する(成功フラグ, 生成された文章)のリスト
         """
-        if not self.is_gemini_available():
-            return False, "Gemini APIキーが設定されていません。設定画面でAPIキーを入力してください。"
+        return self._run_bulk(self.generate_report_content, [(keywords,) for keywords in keywords_list], max_workers)
+    
+    def generate_daily_comment(self, activity_content: str = "", challenges: str = "", improvements: str = "") -> tuple:
+        """
+        日報コメントを生成（職員が1日を振り返るコメント）
         
-        if not text or not text.strip():
-            return False, "テキストが空です。"
+        Args:
+            activity_content: 活動内容（学習支援、自由遊びの見守り、集団遊びの補助など）
+            challenges: 課題
+            improvements: 改善点
+            
+        Returns:
+            (成功フラグ, 生成された日報コメント)
+        """
+        if not self.is_available():
+            return False, "APIキーが設定されていません。設定画面でAPIキーを入力してください。"
         
-        # APIキーが正しく設定されているか確認
-        if not self._ensure_gemini_configured():
-            return False, "Gemini APIキーの設定に失敗しました。設定画面でAPIキーを確認してください。"
+        # プロンプトの構築
+        prompt = _DAILY_COMMENT_PROMPT_TEMPLATE.format(
+            activity=activity_content or "学習支援、自由遊びの見守り、集団遊びの補助",
+            challenges=challenges or "特になし",
+            improvements=improvements or "特になし",
+            example_activity=activity_content or "本日は学習支援、自由遊びの見守り、集団遊びの補助を行いました。",
+            example_challenges=challenges or "特に大きな課題はなかったが、より良い支援ができるよう努めたい。",
+            example_improvements=improvements or "より効果的な支援方法を検討していきたい。"
+        )
         
         try:
-            # 複数段階分析プロセス
-            # ステップ1: テキストのクリーニングと前処理
-            cleaned_text = self._preprocess_meeting_text(text)
-
-            # ステップ2: テキストの分析と構造化
-            analysis_result = self._analyze_meeting_content(cleaned_text)
-
-            # ステップ3: 分類結果の検証と改善
-            validated_result = self._validate_and_improve_classification(cleaned_text, analysis_result)
-
-            return True, validated_result
+            # システムメッセージをactivity_contentの有無で調整
+            system_content = _SYSTEM_DAILY_COMMENT
+            if activity_content:
+                system_content += f" 必ず以下の活動内容を反映させてください：{activity_content}"
+            system_content += _SYSTEM_DAILY_COMMENT_CLOSING
 
+            payload = self._chat_payload(system_content, prompt, temperature=0.7, max_tokens=500)
+            
+            response = self._session.post(
+                self.api_url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                data=_json_dumps(payload),
+                timeout=30
+            )
+            
+            if response.status_code == 200:
+                result = _json_loads(response.content)
+                generated_text = result["choices"][0]["message"]["content"].strip()
+                return True, generated_text
+            else:
+                error_msg = f"APIエラー: {response.status_code} - {response.text}"
+                return False, error_msg
+                
+        except requests.exceptions.Timeout:
+            return False, "APIへの接続がタイムアウトしました。しばらく待ってから再試行してください。"
+        except requests.exceptions.RequestException as e:
+            return False, f"API接続エラー: {str(e)}"
         except Exception as e:
-            print(f"[DEBUG] Exception in generate_meeting_minutes_from_text: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return False, f"議事録生成エラー: {str(e)}"
+            return False, f"予期しないエラーが発生しました: {str(e)}"
+
 
-    
     def generate_hiyari_hatto_report(self, keywords: str, report_type: str = "details") -> tuple:
         """
         ヒヤリハット報告書の各項目の文章を生成
@@ -1023,44 +1340,23 @@ class AIHelper:
 {type_name}に関する文章のみを返してください。"""
         
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "あなたは放課後等デイサービスのベテラン職員で、ヒヤリハット報告書の作成が得意です。客観的で正確な記述を心がけます。"
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.7,
-                "max_tokens": 500
-            }
+            payload = self._chat_payload(
+                _SYSTEM_HIYARI,
+                prompt,
+                temperature=0.7,
+                max_tokens=160  # 100字に切り詰めるため（1字≒1.5トークン＋余裕）
+            )
             
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=30
+            status_code, content = self._cached_chat(
+                payload, cache_input=f"{type_name}\n{_normalize_for_cache(keywords)}", max_chars=100
             )
             
-            if response.status_code == 200:
-                result = response.json()
-                generated_text = result["choices"][0]["message"]["content"]
+            if status_code == 200:
                 # 100字以内に制限
-                generated_text = generated_text.strip()
-                if len(generated_text) > 100:
-                    generated_text = generated_text[:100]
+                generated_text = _truncate_text(content.strip(), 100)
                 return True, generated_text
             else:
-                error_msg = f"APIエラー: {response.status_code} - {response.text}"
+                error_msg = f"APIエラー: {status_code} - {content}"
                 return False, error_msg
                 
         except requests.exceptions.Timeout:
@@ -1070,30 +1366,84 @@ class AIHelper:
         except Exception as e:
             return False, f"予期しないエラーが発生しました: {str(e)}"
     
+    def generate_hiyari_hatto_report_all(self, keywords: str,
+                                         report_types: Sequence[str] = ("context", "details", "countermeasure"),
+                                         max_workers: int = 3) -> Dict[str, tuple]:
+        """
+        ヒヤリハット報告書の複数項目の文章をまとめて生成（並行にAPIを呼び出す）
+        
+        Args:
+            keywords: 箇条書きやキーワード
+            report_types: 生成する項目タイプ（既定は「どうしていた時」「あらまし」「教訓・対策」の3項目）
+            max_workers: 同時に実行する最大数
+            
+        Returns:
+            項目タイプをキーとする(成功フラグ, 生成された文章)の辞書
+        """
+        results = self._run_bulk(
+            self.generate_hiyari_hatto_report,
+            [(keywords, report_type) for report_type in report_types],
+            max_workers
+        )
+        return dict(zip(report_types, results))
+    
     def is_gemini_available(self) -> bool:
         """Gemini APIキーが設定されているかチェック"""
         return GEMINI_AVAILABLE and self.gemini_api_key is not None and self.gemini_api_key.strip() != ""
     
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _clean_api_key(raw: str) -> str:
+        """
+        APIキーをクリーンアップ（余分な空白や改行を削除）
+        
+        複数のAPIキーが結合されている可能性があるため、空白（スペース・タブ・改行）で
+        区切られている場合は最初の部分のみを使用する。
+        
+        Args:
+            raw: 入力されたAPIキー
+            
+        Returns:
+            クリーンアップしたAPIキー
+        """
+        parts = raw.split()
+        return parts[0] if parts else ""
+    
     def _ensure_gemini_configured(self):
         """Gemini APIキーが正しく設定されているか確認し、必要に応じて設定する"""
         if not GEMINI_AVAILABLE or not self.gemini_api_key:
             return False
         
         try:
-            # APIキーをクリーンアップ（余分な空白や改行を削除）
-            api_key = self.gemini_api_key.strip()
-            # 複数のAPIキーが結合されている可能性があるため、最初の有効なキーのみを使用
-            if ' ' in api_key:
-                # スペースで区切られている場合、最初の部分のみを使用
-                api_key = api_key.split()[0]
-            
-            # genai.configure()を再呼び出して、最新のAPIキーを設定
-            genai.configure(api_key=api_key)
+            api_key = self._clean_api_key(self.gemini_api_key)
             self.gemini_api_key = api_key
+            if api_key == self._configured_key:
+                return True
+            
+            # APIキーが変わった場合のみgenai.configure()を再呼び出して設定し、モデルも作り直す
+            genai.configure(api_key=api_key)
+            self._configured_key = api_key
+            self._gemini_models = {}
             return True
         except Exception:
             return False
     
+    def _get_gemini_model(self, system_instruction: str) -> Any:
+        """
+        Gemini 3 Flash Previewのモデルを取得（指示ごとに初回のみ生成し、以降は使い回す）
+        
+        Args:
+            system_instruction: 固定の指示（毎回同じ内容を先頭に置くことでGemini側のキャッシュを効かせる）
+            
+        Returns:
+            Geminiのモデル
+        """
+        model = self._gemini_models.get(system_instruction)
+        if model is None:
+            model = genai.GenerativeModel('gemini-3-flash-preview', system_instruction=system_instruction)
+            self._gemini_models[system_instruction] = model
+        return model
+    
     def transcribe_audio_to_text(self, audio_file_path: str, context_info: Optional[str] = None) -> Tuple[bool, str]:
         """
         音声ファイルをテキストに変換（Gemini 3 Flash Preview使用）
@@ -1118,60 +1468,213 @@ class AIHelper:
         try:
             # ファイル拡張子からMIMEタイプを判定
             file_ext = os.path.splitext(audio_file_path)[1].lower()
-            mime_types = {
-                '.mp3': 'audio/mpeg',
-                '.wav': 'audio/wav',
-                '.m4a': 'audio/mp4',
-                '.ogg': 'audio/ogg',
-                '.flac': 'audio/flac',
-                '.webm': 'audio/webm'
-            }
-            mime_type = mime_types.get(file_ext, 'audio/mpeg')
-            
-            # Gemini 3 Flash Previewを使用して音声をテキストに変換
-            model = genai.GenerativeModel('gemini-3-flash-preview')
-            
-            # 音声ファイルをアップロード
-            audio_file_obj = genai.upload_file(
-                path=audio_file_path,
-                mime_type=mime_type
-            )
-            
-            # プロンプトを設定
-            prompt = """この音声は朝礼の議事録です。音声の内容を正確にテキストに変換してください。
-話し手の言葉をそのまま記録し、言いよどみや繰り返しも含めて正確に書き起こしてください。
-不要な編集は行わず、話された内容を忠実に記録してください。"""
+            mime_type = _AUDIO_MIME_TYPES.get(file_ext, 'audio/mpeg')
             
-            # 補助情報がある場合はプロンプトに追加
+            # 補助情報がある場合のみ、固定の指示とは別にプロンプトとして渡す
+            prompt = ""
             if context_info and context_info.strip():
-                prompt += f"""
-
-以下の情報を参考にして、音声内の名前や固有名詞の認識精度を向上させてください：
+                prompt = f"""以下の情報を参考にして、音声内の名前や固有名詞の認識精度を向上させてください：
 {context_info}
 
 これらの情報を参考にしながら、音声の内容を正確にテキストに変換してください。"""
             
-            # 音声認識を実行
-            response = model.generate_content([prompt, audio_file_obj])
-            
-            # テキストを取得
-            transcribed_text = response.text.strip()
-            
-            # アップロードしたファイルを削除
-            genai.delete_file(audio_file_obj.name)
+            # 長いWAV音声は分割して並行に書き起こす（他の形式は分割にデコーダが必要なため一括で処理）
+            chunk_paths = _split_wav(audio_file_path) if file_ext == '.wav' else []
+            if not chunk_paths:
+                return True, self._transcribe_file(audio_file_path, mime_type, prompt)
             
-            return True, transcribed_text
+            try:
+                with ThreadPoolExecutor(max_workers=min(len(chunk_paths), 8)) as executor:
+                    parts = list(executor.map(
+                        lambda path: self._transcribe_file(path, mime_type, prompt),
+                        chunk_paths
+                    ))
+            finally:
+                for path in chunk_paths:
+                    if os.path.exists(path):
+                        os.unlink(path)
+            
+            return True, _merge_transcripts(parts)
             
         except Exception as e:
             return False, f"音声認識エラー: {str(e)}"
     
-    def generate_meeting_minutes_from_audio(self, audio_file_path: str, context_info: Optional[str] = None) -> Tuple[bool, Dict[str, str]]:
+    async def atranscribe_audio_to_text(self, audio_file_path: str, context_info: Optional[str] = None) -> Tuple[bool, str]:
+        """
+        transcribe_audio_to_textの非同期版（アップロードと音声認識をワーカースレッドで実行し、イベントループを止めない）
+        
+        Args:
+            audio_file_path: 音声ファイルのパス
+            context_info: 補助情報（名前、固有名詞など）を記載したテキスト
+            
+        Returns:
+            (成功フラグ, 変換されたテキストまたはエラーメッセージ)
+        """
+        return await asyncio.to_thread(self.transcribe_audio_to_text, audio_file_path, context_info)
+    
+    def _transcribe_file(self, audio_file_path: str, mime_type: str, prompt: str) -> str:
+        """
+        音声ファイル1つを書き起こす（同じ音声・プロンプトの結果はキャッシュから返す）
+        
+        Args:
+            audio_file_path: 音声ファイルのパス
+            mime_type: 音声ファイルのMIMEタイプ
+            prompt: 補助情報のプロンプト（なければ空文字列）
+            
+        Returns:
+            書き起こしたテキスト
+        """
+        # Gemini 3 Flash Previewを使用して音声をテキストに変換
+        model = self._get_gemini_model(_TRANSCRIBE_PROMPT)
+        
+        # 同じ音声・補助情報の書き起こし結果があれば再利用
+        audio_hash = _file_digest(audio_file_path)
+        cache_key = _cache_key({
+            "model": "gemini-3-flash-preview",
+            "system": _TRANSCRIBE_PROMPT,
+            "prompt": prompt,
+            "audio": audio_hash
+        })
+        transcribed_text = self._cache.get(cache_key) if self._cache is not None else None
+        if transcribed_text is not None:
+            return transcribed_text
+        
+        audio_file_obj = self._audio_part(audio_file_path, mime_type, audio_hash)
+        try:
+            # 音声認識を実行
+            response = model.generate_content([prompt, audio_file_obj] if prompt else [audio_file_obj])
+        finally:
+            self._release_audio(audio_file_obj, audio_hash, mime_type)
+        
+        # テキストを取得
+        transcribed_text = response.text.strip()
+        if transcribed_text and self._cache is not None:
+            self._cache.set(cache_key, transcribed_text)
+        
+        return transcribed_text
+    
+    def _audio_part(self, audio_file_path: str, mime_type: str, audio_hash: str) -> Any:
+        """
+        Geminiに渡す音声を用意（小さいファイルはアップロードせずデータを直接含める）
+        
+        Args:
+            audio_file_path: 音声ファイルのパス
+            mime_type: 音声ファイルのMIMEタイプ
+            audio_hash: 音声ファイルのSHA256ハッシュ
+            
+        Returns:
+            音声データの辞書またはGeminiのファイルオブジェクト
+        """
+        if os.path.getsize(audio_file_path) <= AUDIO_INLINE_MAX_BYTES:
+            # アップロードと処理完了待ちの往復を省く
+            with open(audio_file_path, "rb") as f:
+                return {"mime_type": mime_type, "data": f.read()}
+        return self._upload_audio(audio_file_path, mime_type, audio_hash)
+    
+    def _upload_audio(self, audio_file_path: str, mime_type: str, audio_hash: str) -> Any:
+        """
+        音声ファイルをGeminiにアップロード（同じ音声の再処理ではアップロード済みのファイルを再利用）
+        
+        Args:
+            audio_file_path: 音声ファイルのパス
+            mime_type: 音声ファイルのMIMEタイプ
+            audio_hash: 音声ファイルのSHA256ハッシュ
+            
+        Returns:
+            Geminiのファイルオブジェクト
+        """
+        audio_file_obj = self._get_uploaded_audio(audio_hash, mime_type)
+        if audio_file_obj is None:
+            # 音声ファイルをアップロード
+            audio_file_obj = genai.upload_file(
+                path=audio_file_path,
+                mime_type=mime_type
+            )
+            if self._cache is not None:
+                self._cache.set(f"upload:{audio_hash}:{mime_type}", audio_file_obj.name, ttl=AUDIO_UPLOAD_TTL)
+        
+        return audio_file_obj
+    
+    def _release_audio(self, audio_file_obj: Any, audio_hash: str, mime_type: str) -> None:
+        """
+        使い終わったアップロード済み音声ファイルを片付ける（エラー時も呼び出す）
+        
+        再試行に備えてキャッシュに登録されている場合のみ残し（キャッシュから外れた時点で削除）、
+        それ以外は応答を待たせないよう後片付け用のスレッドで削除する。
+        
+        Args:
+            audio_file_obj: 音声データの辞書またはGeminiのファイルオブジェクト
+            audio_hash: 音声ファイルのSHA256ハッシュ
+            mime_type: 音声ファイルのMIMEタイプ
+        """
+        if isinstance(audio_file_obj, dict):
+            return
+        if self._cache is not None and self._cache.get(f"upload:{audio_hash}:{mime_type}") == audio_file_obj.name:
+            return
+        self._delete_uploaded_audio(audio_file_obj.name)
+    
+    def _get_uploaded_audio(self, audio_hash: str, mime_type: str) -> Optional[Any]:
+        """
+        アップロード済みの音声ファイルを取得（未アップロードまたは期限切れの場合はNone）
+        
+        Args:
+            audio_hash: 音声ファイルのSHA256ハッシュ
+            mime_type: 音声ファイルのMIMEタイプ（同じ内容でも拡張子が異なれば別ファイルとして扱う）
+            
+        Returns:
+            Geminiのファイルオブジェクト
+        """
+        if self._cache is None:
+            return None
+        file_name = self._cache.get(f"upload:{audio_hash}:{mime_type}")
+        if file_name is None:
+            return None
+        try:
+            return genai.get_file(file_name)
+        except Exception:
+            # 取得できない場合は登録を外して再アップロードし、残っていれば削除しておく
+            self._cache.pop(f"upload:{audio_hash}:{mime_type}")
+            self._delete_uploaded_audio(file_name)
+            return None
+    
+    def _on_cache_evict(self, key: str, value: str) -> None:
+        """キャッシュから外れたアップロード済み音声は再利用しないため、Gemini側からも削除する"""
+        if key.startswith("upload:"):
+            self._delete_uploaded_audio(value)
+    
+    def _delete_uploaded_audio(self, file_name: str) -> None:
+        """
+        アップロード済みの音声ファイルを削除（応答を待たせないよう後片付け用のスレッドで実行）
+        
+        Args:
+            file_name: Geminiのファイル名
+        """
+        if not GEMINI_AVAILABLE:
+            return
+        
+        def delete():
+            try:
+                genai.delete_file(file_name)
+            except Exception:
+                # 削除できなくてもGemini側の保持期間（48時間）で自動削除される
+                pass
+        
+        _CLEANUP_POOL.submit(delete)
+    
+    def generate_meeting_minutes_from_audio(self, audio_file_path: str, context_info: Optional[str] = None,
+                                            fallback: bool = True,
+                                            on_partial: Optional[Callable[[Dict[str, str]], None]] = None) -> Tuple[bool, Dict[str, str]]:
         """
         音声ファイルから朝礼議事録を生成（Gemini 3 Flash Preview使用）
         
+        書き起こしと構造化を1回の呼び出しで行い、結果を解析できない場合は
+        書き起こし→構造化の2段階で生成し直す。
+        
         Args:
             audio_file_path: 音声ファイルのパス
             context_info: 補助情報（名前、固有名詞など）を記載したテキスト
+            fallback: 1回の呼び出しで生成できなかった場合に2段階で生成し直すか
+            on_partial: 生成途中の議事録（読み取れた項目のみ）を受け取るコールバック
             
         Returns:
             (成功フラグ, 議事録データの辞書またはエラーメッセージ)
@@ -1183,31 +1686,142 @@ class AIHelper:
             return False, "音声ファイルが見つかりません。"
         
         try:
+            # 音声から直接議事録を生成（書き起こしのための往復を省く）
+            meeting_data = self._analyze_meeting_audio(audio_file_path, context_info, on_partial)
+            if meeting_data is not None:
+                return True, self._validate_and_improve_classification("", meeting_data)
+            if not fallback:
+                return False, "音声から議事録を生成できませんでした。"
+            
             # まず音声をテキストに変換（補助情報を含める）
-            print("[DEBUG] Starting audio transcription")
+            logger.debug("Starting audio transcription")
             success, transcribed_text = self.transcribe_audio_to_text(audio_file_path, context_info)
-            print(f"[DEBUG] Transcription result: success={success}, text_length={len(transcribed_text) if transcribed_text else 0}")
+            logger.debug("Transcription result: success=%s, text_length=%d", success, len(transcribed_text) if transcribed_text else 0)
             if not success:
                 return False, transcribed_text
 
             # テキストから議事録を構造化
-            print("[DEBUG] Starting meeting minutes generation")
-            result = self.generate_meeting_minutes_from_text(transcribed_text)
-            print(f"[DEBUG] Final result: {result}")
+            logger.debug("Starting meeting minutes generation")
+            result = self.generate_meeting_minutes_from_text(transcribed_text, on_partial)
+            logger.debug("Final result: %s", result)
             return result
 
         except Exception as e:
-            print(f"[DEBUG] Exception in generate_meeting_minutes_from_audio: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Exception in generate_meeting_minutes_from_audio: %s", e)
             return False, f"議事録生成エラー: {str(e)}"
     
-    def generate_meeting_minutes_from_text(self, text: str) -> Tuple[bool, Dict[str, str]]:
+    async def agenerate_meeting_minutes_from_audio(self, audio_file_path: str, context_info: Optional[str] = None,
+                                                   fallback: bool = True) -> Tuple[bool, Dict[str, str]]:
+        """
+        generate_meeting_minutes_from_audioの非同期版（ワーカースレッドで実行し、イベントループを止めない）
+        
+        Args:
+            audio_file_path: 音声ファイルのパス
+            context_info: 補助情報（名前、固有名詞など）を記載したテキスト
+            fallback: 1回の呼び出しで生成できなかった場合に2段階で生成し直すか
+            
+        Returns:
+            (成功フラグ, 議事録データの辞書またはエラーメッセージ)
+        """
+        return await asyncio.to_thread(self.generate_meeting_minutes_from_audio, audio_file_path, context_info, fallback)
+    
+    def _generate_meeting_json(self, model: Any, contents: Any,
+                               on_partial: Optional[Callable[[Dict[str, str]], None]] = None) -> str:
+        """
+        Geminiで議事録JSONを生成（on_partial指定時はストリーミングで受信し、途中経過を通知）
+        
+        Args:
+            model: Geminiのモデル
+            contents: プロンプト（音声ファイルを含む場合はリスト）
+            on_partial: 受信途中の項目（議題・内容など）を受け取るコールバック
+            
+        Returns:
+            生成されたテキスト
+        """
+        generation_config = genai.types.GenerationConfig(
+            temperature=0.1,  # より決定論的に
+            max_output_tokens=3000  # より長い出力に対応
+        )
+        if on_partial is None:
+            response = model.generate_content(contents, generation_config=generation_config)
+            return response.text.strip()
+        
+        buffer = ""
+        last_fields: Dict[str, str] = {}
+        for chunk in model.generate_content(contents, generation_config=generation_config, stream=True):
+            buffer += chunk.text
+            fields = _partial_meeting_fields(buffer)
+            if fields and fields != last_fields:
+                on_partial(fields)
+                last_fields = fields
+        return buffer.strip()
+    
+    def _analyze_meeting_audio(self, audio_file_path: str, context_info: Optional[str] = None,
+                               on_partial: Optional[Callable[[Dict[str, str]], None]] = None) -> Optional[Dict[str, str]]:
+        """
+        音声ファイルから1回の呼び出しで議事録を構造化する
+        
+        Args:
+            audio_file_path: 音声ファイルのパス
+            context_info: 補助情報（名前、固有名詞など）を記載したテキスト
+            on_partial: 受信途中の項目を受け取るコールバック
+            
+        Returns:
+            議事録データの辞書（生成・解析できなかった場合はNone）
+        """
+        try:
+            if not self._ensure_gemini_configured():
+                return None
+            
+            file_ext = os.path.splitext(audio_file_path)[1].lower()
+            mime_type = _AUDIO_MIME_TYPES.get(file_ext, 'audio/mpeg')
+            
+            prompt = ""
+            if context_info and context_info.strip():
+                prompt = f"""以下の情報を参考にして、音声内の名前や固有名詞の認識精度を向上させてください：
+{context_info}
+"""
+            
+            audio_hash = _file_digest(audio_file_path)
+            cache_key = _cache_key({
+                "model": "gemini-3-flash-preview",
+                "system": _MEETING_AUDIO_PROMPT,
+                "prompt": prompt,
+                "audio": audio_hash,
+                "temperature": 0.1,
+                "max_output_tokens": 3000
+            })
+            response_text = self._cache.get(cache_key) if self._cache is not None else None
+            if response_text is None:
+                model = self._get_gemini_model(_MEETING_AUDIO_PROMPT)
+                audio_file_obj = self._audio_part(audio_file_path, mime_type, audio_hash)
+                try:
+                    contents = [prompt, audio_file_obj] if prompt else [audio_file_obj]
+                    response_text = self._generate_meeting_json(model, contents, on_partial)
+                finally:
+                    self._release_audio(audio_file_obj, audio_hash, mime_type)
+            
+            meeting_data = _json_loads_lenient(_extract_json(response_text))
+            if not isinstance(meeting_data, dict) or not meeting_data.get("議題・内容"):
+                return None
+            
+            if self._cache is not None:
+                self._cache.set(cache_key, response_text)
+            return {**_DEFAULT_MINUTES, **meeting_data}
+        
+        except Exception as e:
+            logger.debug("Single-pass audio analysis failed: %s", e)
+            return None
+    
+    def generate_meeting_minutes_from_text(self, text: str,
+                                           on_partial: Optional[Callable[[Dict[str, str]], None]] = None) -> Tuple[bool, Dict[str, str]]:
         """
         テキストから朝礼議事録を構造化して生成（Gemini 3 Flash Preview使用）
         
         Args:
             text: 議事録の元となるテキスト
+            on_partial: 生成途中の議事録（読み取れた項目のみ）を受け取るコールバック。
+                指定するとストリーミングで受信し、議題・内容などを届いた順に通知する
             
         Returns:
             (成功フラグ, 議事録データの辞書またはエラーメッセージ)
@@ -1227,62 +1841,70 @@ class AIHelper:
             # ステップ1: テキストのクリーニングと前処理
             cleaned_text = self._preprocess_meeting_text(text)
 
-            # ステップ2: テキストの分析と構造化
-            analysis_result = self._analyze_meeting_content(cleaned_text)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # タイトル生成（Grok）は構造化（Gemini）の結果を待たずに並行して実行
+                title_future = executor.submit(self.generate_title_from_text, cleaned_text) if self.is_available() else None
+
+                # ステップ2: テキストの分析と構造化
+                analysis_result = self._analyze_meeting_content(cleaned_text, on_partial)
 
-            # ステップ3: 分類結果の検証と改善
-            validated_result = self._validate_and_improve_classification(cleaned_text, analysis_result)
+                # ステップ3: 分類結果の検証と改善
+                validated_result = self._validate_and_improve_classification(cleaned_text, analysis_result)
+
+                if title_future is not None and not validated_result.get("タイトル"):
+                    title_success, title = title_future.result()
+                    if title_success and title:
+                        validated_result["タイトル"] = title
 
             return True, validated_result
 
         except Exception as e:
-            print(f"[DEBUG] Exception in generate_meeting_minutes_from_text: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Exception in generate_meeting_minutes_from_text: %s", e)
             return False, f"議事録生成エラー: {str(e)}"
 
-    def _analyze_meeting_content(self, text: str) -> Dict[str, str]:
+    def _analyze_meeting_content(self, text: str,
+                                 on_partial: Optional[Callable[[Dict[str, str]], None]] = None) -> Dict[str, str]:
         """
-        会議内容をAIで分析・構造化する
+        会議内容をAIで分析・構造化する（on_partial指定時は受信途中の項目を通知）
         """
-        print(f"[DEBUG] _analyze_meeting_content called with text length: {len(text)}")
+        logger.debug("_analyze_meeting_content called with text length: %d", len(text))
 
         try:
             # API設定の確認
             if not self._ensure_gemini_configured():
-                print("[DEBUG] Gemini config failed, using fallback")
+                logger.debug("Gemini config failed, using fallback")
                 return self._fallback_parse_meeting_text(text, "")
 
             # Gemini 3 Flash Previewを使用して高度な議事録構造化
-            model = genai.GenerativeModel('gemini-3-flash-preview')
-            print("[DEBUG] Gemini model created successfully")
-
-            prompt = f"""あなたは保育園の朝礼を分析するアシスタントです。以下のテキストから議事録を作成してください。
-            テキスト:            {text}
-            以下のJSON形式で出力してください：            {{            "議題・内容": "会議の主要な話題と議論内容",            "決定事項": "決定された具体的な事項",            "共有事項": "スタッフへの連絡事項",            "その他メモ": "会議のタイムライン"            }}
-            注意:            - 必ず有効なJSON形式で出力            - 各項目は簡潔にまとめる            - 日本語で記述            - JSON以外は何も出力しない            """
-            print(f"[DEBUG] Sending prompt to Gemini, length: {len(prompt)}")
-            response = model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.1,  # より決定論的に
-                    max_output_tokens=3000  # より長い出力に対応
-                )
-            )
-            print(f"[DEBUG] Received response from Gemini")
+            model = self._get_gemini_model(_MEETING_ANALYSIS_PROMPT)
+            logger.debug("Gemini model ready")
+
+            # 固定の指示はsystem_instructionで渡し（Geminiの暗黙的キャッシュが効く）、会議テキストだけを送る
+            prompt = f"テキスト:\n{text}"
+            cache_key = _cache_key({
+                "model": "gemini-3-flash-preview",
+                "system": _MEETING_ANALYSIS_PROMPT,
+                "prompt": prompt,
+                "temperature": 0.1,
+                "max_output_tokens": 3000
+            })
+            response_text = self._cache.get(cache_key) if self._cache is not None else None
+            if response_text is None:
+                logger.debug("Sending prompt to Gemini, length: %d", len(prompt))
+                response_text = self._generate_meeting_json(model, prompt, on_partial)
+                logger.debug("Received response from Gemini")
+                if response_text and self._cache is not None:
+                    self._cache.set(cache_key, response_text)
             
 
             # JSONをパース
-            # JSONをパース
-            import json
-            import re
-            response_text = response.text.strip()
-            print(f"[DEBUG] Response text length: {len(response_text)}")
-            print(f"[DEBUG] Response text preview: {response_text[:200]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response text length: %d", len(response_text))
+                logger.debug("Response text preview: %s...", response_text[:200])
 
             # レスポンスが空でないかチェック
             if not response_text:
-                print("[DEBUG] Response text is empty")
+                logger.debug("Response text is empty")
                 return {
                     "議題・内容": text[:1000] if len(text) > 1000 else text,
                     "決定事項": "",
@@ -1291,38 +1913,28 @@ class AIHelper:
                 }
 
             # JSON部分を抽出（コードブロックがあれば除去）
-            json_match = re.search(r'\{[\s\S]*\}', response_text)
-            if json_match:
-                json_str = json_match.group(0)
-            else:
-                json_str = response_text
+            json_str = _extract_json(response_text)
 
             # JSONパースを試行
-            print(f"[DEBUG] Attempting to parse JSON, length: {len(json_str)}")
+            logger.debug("Attempting to parse JSON, length: %d", len(json_str))
             try:
-                meeting_data = json.loads(json_str)
-                print(f"[DEBUG] JSON parse successful, keys: {list(meeting_data.keys())}")
+                meeting_data = _json_loads_lenient(json_str)
+                logger.debug("JSON parse successful, keys: %s", list(meeting_data.keys()))
             except json.JSONDecodeError as json_error:
                 # JSONパースに失敗した場合、テキストから手動で構造化
-                print(f"[DEBUG] JSON parse failed: {json_error}, using fallback")
+                logger.debug("JSON parse failed: %s, using fallback", json_error)
                 meeting_data = self._fallback_parse_meeting_text(text, response_text)
         
-            # 必須フィールドの確認
-            if "議題・内容" not in meeting_data:
+            # 含まれない項目を空文字列で補い、議題・内容が空なら元のテキストで代用する
+            meeting_data = {**_DEFAULT_MINUTES, **meeting_data}
+            if not meeting_data["議題・内容"]:
                 meeting_data["議題・内容"] = text[:500]  # フォールバック
 
-            # 空のフィールドを空文字列に設定
-            for key in ["決定事項", "共有事項", "その他メモ"]:
-                if key not in meeting_data:
-                    meeting_data[key] = ""
-
-            print(f"[DEBUG] Returning meeting_data with keys: {list(meeting_data.keys())}")
+            logger.debug("Returning meeting_data with keys: %s", list(meeting_data.keys()))
             return meeting_data
 
         except Exception as e:
-            print(f"[DEBUG] Exception in _analyze_meeting_content: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Exception in _analyze_meeting_content: %s", e)
             return self._fallback_parse_meeting_text(text, "")
 
     def _fallback_parse_meeting_text(self, original_text: str, ai_response: str) -> Dict[str, str]:
@@ -1406,6 +2018,13 @@ class AIHelper:
                 # 最初の30文と最後の20文を保持
                 cleaned = '。'.join(sentences[:30] + sentences[-20:]) + '。'
 
+        # 句点の少ない書き起こしなどで上限を超える場合は、冒頭と末尾を残して中間を省く
+        if len(cleaned) > MEETING_STRUCTURE_MAX_CHARS:
+            logger.warning("Meeting text too long (%d chars), trimming to %d", len(cleaned), MEETING_STRUCTURE_MAX_CHARS)
+            head_length = MEETING_STRUCTURE_MAX_CHARS * 3 // 5
+            tail_length = MEETING_STRUCTURE_MAX_CHARS - head_length
+            cleaned = f"{cleaned[:head_length]}\n（中略）\n{cleaned[-tail_length:]}"
+
         return cleaned
 
     def _validate_and_improve_classification(self, original_text: str, analysis_result: Dict[str, str]) -> Dict[str, str]:
@@ -3,6 +3,7 @@
 Streamlitアプリケーション
 """
 import streamlit as st
+import io
 import os
 import json
 from datetime import date, datetime, time
@@ -17,6 +18,9 @@ from ai_helper import AIHelper
 from accident_report_generator import AccidentReportGenerator
 from hiyari_hatto_generator import HiyariHattoGenerator
 
+# 曜日の表記（date.weekday()の戻り値順）
+WEEKDAY_NAMES = ("月", "火", "水", "木", "金", "土", "日")
+
 
 # ページ設定
 st.set_page_config(
@@ -1424,8 +1428,7 @@ def render_daily_report_form():
             
             with col_date2:
                 # 曜日を自動計算して表示
-                weekday_map = ["月", "火", "水", "木", "金", "土", "日"]
-                weekday_name = weekday_map[incident_date.weekday()]
+                weekday_name = WEEKDAY_NAMES[incident_date.weekday()]
                 st.markdown(f"<br><br><strong>（{weekday_name}曜日）</strong>", unsafe_allow_html=True)
             
             # 発生時刻
@@ -1548,8 +1551,7 @@ def render_daily_report_form():
             
             with col_date2:
                 # 曜日を自動計算して表示
-                weekday_map = ["月", "火", "水", "木", "金", "土", "日"]
-                weekday_name = weekday_map[hiyari_date.weekday()]
+                weekday_name = WEEKDAY_NAMES[hiyari_date.weekday()]
                 st.markdown(f"<br><br><strong>（{weekday_name}曜日）</strong>", unsafe_allow_html=True)
             
             # 発生時刻
@@ -2191,25 +2193,13 @@ def render_daily_report_form():
                     accident_title = st.session_state.ai_helper.ensure_title_format(accident_title_input.strip(), ai_generated_content if ai_generated_content else (report_content if report_content else incident_situation))
                 elif ai_generated_content and ai_generated_content.strip():
                     # AI生成の報告内容から自動生成
-                    title_success, generated_title = st.session_state.ai_helper.generate_title_from_text(ai_generated_content)
-                    if title_success and generated_title:
-                        accident_title = generated_title
-                    else:
-                        accident_title = st.session_state.ai_helper.ensure_title_format("", ai_generated_content)
+                    accident_title = st.session_state.ai_helper.finalize_title(ai_generated_content)
                 elif report_content and report_content.strip():
                     # タイトルが入力されていない場合は、報告内容から自動生成
-                    title_success, generated_title = st.session_state.ai_helper.generate_title_from_text(report_content)
-                    if title_success and generated_title:
-                        accident_title = generated_title
-                    else:
-                        accident_title = st.session_state.ai_helper.ensure_title_format("", report_content)
+                    accident_title = st.session_state.ai_helper.finalize_title(report_content)
                 elif incident_situation and incident_situation.strip():
                     # 報告内容がない場合は、事故発生の状況から自動生成
-                    title_success, generated_title = st.session_state.ai_helper.generate_title_from_text(incident_situation)
-                    if title_success and generated_title:
-                        accident_title = generated_title
-                    else:
-                        accident_title = st.session_state.ai_helper.ensure_title_format("", incident_situation)
+                    accident_title = st.session_state.ai_helper.finalize_title(incident_situation)
                 else:
                     # フォールバック
                     accident_title = "事故報告の件"
@@ -2272,8 +2262,7 @@ def render_daily_report_form():
                             incident_date = datetime.combine(work_date, time(incident_time_hour, incident_time_min))
                         
                         # 曜日を計算
-                        weekday_map = ["月", "火", "水", "木", "金", "土", "日"]
-                        weekday_name = weekday_map[incident_date.weekday()]
+                        weekday_name = WEEKDAY_NAMES[incident_date.weekday()]
                         
                         # セッション状態から事業者名と報告内容を取得
                         facility_name = st.session_state.get("facility_name", "放課後等デイサービス")
@@ -2358,11 +2347,7 @@ def render_daily_report_form():
                     hiyari_title = st.session_state.ai_helper.ensure_title_format(hiyari_title_input.strip(), hiyari_details if hiyari_details else "")
                 elif hiyari_details and hiyari_details.strip():
                     # タイトルが入力されていない場合は、ヒヤリとした時のあらましから自動生成
-                    title_success, generated_title = st.session_state.ai_helper.generate_title_from_text(hiyari_details)
-                    if title_success and generated_title:
-                        hiyari_title = generated_title
-                    else:
-                        hiyari_title = st.session_state.ai_helper.ensure_title_format("", hiyari_details)
+                    hiyari_title = st.session_state.ai_helper.finalize_title(hiyari_details)
                 else:
                     # フォールバック
                     hiyari_title = "ヒヤリハット報告の件"
@@ -2546,26 +2531,20 @@ def render_daily_report_form():
         pdf_gen_data = st.session_state["pdf_generate_data"]
         try:
             if pdf_gen_data["type"] == "accident":
-                # 事故報告書PDFを生成
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                    pdf_filename = tmp_file.name
-                    generator = AccidentReportGenerator(pdf_filename)
-                    generator.generate(pdf_gen_data["pdf_data"])
-                    
-                    # PDFファイルを読み込んでダウンロードボタンを表示
-                    with open(pdf_filename, "rb") as pdf_file:
-                        pdf_bytes = pdf_file.read()
-                        st.download_button(
-                            label="📥 事故報告書PDFをダウンロード",
-                            data=pdf_bytes,
-                            file_name=pdf_gen_data["file_name"],
-                            mime="application/pdf",
-                            use_container_width=True,
-                            key="download_accident_pdf"
-                        )
-                    
-                    # 一時ファイルを削除
-                    os.unlink(pdf_filename)
+                # 事故報告書PDFをメモリ上に生成（一時ファイルを経由しない）
+                pdf_buffer = io.BytesIO()
+                generator = AccidentReportGenerator(output=pdf_buffer)
+                generator.generate(pdf_gen_data["pdf_data"])
+                
+                # ダウンロードボタンを表示
+                st.download_button(
+                    label="📥 事故報告書PDFをダウンロード",
+                    data=pdf_buffer.getvalue(),
+                    file_name=pdf_gen_data["file_name"],
+                    mime="application/pdf",
+                    use_container_width=True,
+                    key="download_accident_pdf"
+                )
                     
             elif pdf_gen_data["type"] == "hiyari":
                 # ヒヤリハット報告書PDFを生成
@@ -3021,9 +3000,6 @@ def render_daily_users_calendar():
             key="calendar_month"
         )
     
-    # カレンダーのヘッダー
-    weekdays = ["月", "火", "水", "木", "金", "土", "日"]
-    
     # カレンダーグリッドを作成
     cal = calendar.monthcalendar(selected_year, selected_month)
     
@@ -3032,7 +3008,7 @@ def render_daily_users_calendar():
     
     # 曜日ヘッダーを表示
     header_cols = st.columns(7)
-    for i, weekday in enumerate(weekdays):
+    for i, weekday in enumerate(WEEKDAY_NAMES):
         with header_cols[i]:
             st.markdown(f"**{weekday}**", unsafe_allow_html=True)
     
@@ -3312,11 +3288,19 @@ def render_morning_meeting():
                             # 補助情報を取得
                             context_info = st.session_state.get("audio_context_info", "")
                             
+                            # 生成途中の議題・内容を表示するプレースホルダー
+                            preview_placeholder = st.empty()
+                            
+                            def show_partial_minutes(fields):
+                                preview_placeholder.info(fields.get("議題・内容", ""))
+                            
                             # 音声から議事録を生成（補助情報を含める）
                             success, result = st.session_state.ai_helper.generate_meeting_minutes_from_audio(
                                 tmp_audio_path,
-                                context_info=context_info if context_info else None
+                                context_info=context_info if context_info else None,
+                                on_partial=show_partial_minutes
                             )
+                            preview_placeholder.empty()
                             
                             if success and isinstance(result, dict):
                                 # 生成された議事録をフォームに反映
@@ -3445,15 +3429,7 @@ def render_morning_meeting():
                         final_title = st.session_state.ai_helper.ensure_title_format(final_title, agenda if agenda else "")
                     elif agenda and agenda.strip():
                         # タイトルが入力されていない場合は、議題・内容から自動生成
-                        title_success, generated_title = st.session_state.ai_helper.generate_title_from_text(agenda)
-                        if title_success and generated_title:
-                            final_title = generated_title
-                            # 最終確認: 必ず「の件」で終わることを確認（二重チェック）
-                            if not final_title.endswith("の件"):
-                                final_title = st.session_state.ai_helper.ensure_title_format(final_title, agenda)
-                        else:
-                            # フォールバック: 簡易的にタイトルを生成（必ず「の件」形式）
-                            final_title = st.session_state.ai_helper.ensure_title_format("", agenda)
+                        final_title = st.session_state.ai_helper.finalize_title(agenda)
                     else:
                         # フォールバック
                         final_title = "議事録の件"